@@ -4,24 +4,27 @@ Main entry point for the DStone application.
 This script initializes the DStone instance and runs the application.
 """
 
-# Change the caching directory
+# Change the caching directory before anything else is imported. Skipped when it
+# cannot be written to, as every import would otherwise probe it in vain.
+import os
 import sys
-sys.pycache_prefix = "/tmp/dstone/"
+if sys.pycache_prefix is None and os.access("/tmp", os.W_OK):
+    sys.pycache_prefix = "/tmp/dstone/"
 
 # Python Imports
-import yaml
 import logging
 from pathlib import Path
 
 # Local Imports
-from src import factory
-from src.core.exceptions import DependencyError
 from src.api.utils.logging import configure_main_logger
 from src.api.io.fs import get_project_root
 
 
 def dstone_main(configs: dict, dstone_root: Path):
 
+    # Deferred so that importing this module does not pull in Dash and the plugin system
+    from src import factory
+
     logger = logging.getLogger(__name__)
 
     dstone = factory.create_dstone_instance(configs, dstone_root)
@@ -33,22 +36,30 @@ def dstone_main(configs: dict, dstone_root: Path):
 
 if __name__ == "__main__":
 
+    import yaml
+    try:
+        # libyaml based loader, much faster than the pure Python one
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    from src.core.exceptions import DependencyError
+
     configure_main_logger('INFO')
     logger = logging.getLogger(__name__)
 
     # Load dstone configuratoins
     dstone_root = get_project_root()
     config_path = dstone_root / 'config.yml'
-    with open(config_path, 'r') as config_file:
-        configs = yaml.safe_load(config_file)
+    with open(config_path, 'rb') as config_file:
+        configs = yaml.load(config_file, Loader=SafeLoader)
 
     try:
         dstone_main(configs, dstone_root)
 
     except DependencyError as e:
-        logger.error(f"Dependency Error: {e}")
+        logger.error("Dependency Error: %s", e)
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         sys.exit(1)
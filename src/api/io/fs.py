@@ -6,19 +6,25 @@ It includes functions for file and directory manipulation, as well as advanced s
 """
 
 import os
+import re
 import shutil
+import functools
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Union, Callable, Iterator
 import fnmatch
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the root directory of the project.
 
-    This function traverses up the directory tree from the current file
-    until it finds a directory containing a '.git' folder or a 'src' folder,
-    which is assumed to be the project root.
+    If the DSTONE_ROOT environment variable is set, its value is used as the
+    project root. Otherwise, this function traverses up the directory tree from
+    the current file until it finds a directory containing a '.git' folder or a
+    'src' folder, which is assumed to be the project root. The result is cached,
+    so the file system is only probed on the first call.
 
     Returns:
         Path: The path to the project root directory.
@@ -26,6 +32,10 @@ def get_project_root() -> Path:
     Raises:
         FileNotFoundError: If the project root cannot be determined.
     """
+    env_root = os.environ.get('DSTONE_ROOT')
+    if env_root:
+        return Path(env_root)
+
     current_path = Path(__file__).resolve().parent
     while current_path != current_path.parent:
         if (current_path / '.git').exists() or (current_path / 'src').exists():
@@ -35,6 +45,19 @@ def get_project_root() -> Path:
     raise FileNotFoundError("Could not determine the project root directory.")
 
 
+def _as_path(path: Union[str, Path]) -> Path:
+    """
+    Return the given path as a Path object, without copying it if it already is one.
+
+    Args:
+        path (Union[str, Path]): The path to convert.
+
+    Returns:
+        Path: The path as a Path object.
+    """
+    return path if isinstance(path, Path) else Path(path)
+
+
 def list_files(directory: Union[str, Path], extension: str = None) -> List[str]:
     """
     List all files in a directory, optionally filtering by extension.
@@ -49,13 +72,14 @@ def list_files(directory: Union[str, Path], extension: str = None) -> List[str]:
     Raises:
         FileNotFoundError: If the directory does not exist.
     """
-    path = Path(directory)
+    path = _as_path(directory)
     if not path.exists():
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    if extension:
-        return [f.name for f in path.glob(f'*.{extension}')]
-    return [f.name for f in path.glob('*') if f.is_file()]
+    suffix = f'.{extension}' if extension else None
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries
+                if entry.is_file() and (suffix is None or entry.name.endswith(suffix))]
 
 
 def delete_file(path: Union[str, Path]) -> None:
@@ -69,25 +93,36 @@ def delete_file(path: Union[str, Path]) -> None:
         FileNotFoundError: If the file does not exist.
         OSError: If the file cannot be deleted.
     """
-    file_path = Path(path)
+    file_path = _as_path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     file_path.unlink()
 
 
-def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+def copy_file(src: Union[str, Path], dst: Union[str, Path], preserve_metadata: bool = False) -> None:
     """
     Copy a file from source to destination.
 
+    Without metadata preservation only the file contents are copied, which lets
+    shutil use the platform's fast copy (e.g. sendfile on Linux) and skips the
+    extra calls needed to copy permissions and timestamps.
+
     Args:
         src (Union[str, Path]): The path of the source file.
         dst (Union[str, Path]): The path of the destination file.
+        preserve_metadata (bool, optional): If True, also copy the permission bits,
+            timestamps and other metadata of the source file. Defaults to False.
 
     Raises:
         FileNotFoundError: If the source file does not exist.
         OSError: If the file cannot be copied.
     """
-    shutil.copy2(src, dst)
+    if preserve_metadata:
+        shutil.copy2(src, dst)
+    else:
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        shutil.copyfile(src, dst)
 
 
 def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
@@ -118,7 +153,7 @@ def get_file_size(path: Union[str, Path]) -> int:
     Raises:
         FileNotFoundError: If the file does not exist.
     """
-    file_path = Path(path)
+    file_path = _as_path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {path}")
     return file_path.stat().st_size
@@ -139,8 +174,12 @@ def read_text_file(path: Union[str, Path], encoding: str = 'utf-8') -> str:
         FileNotFoundError: If the file does not exist.
         IOError: If the file cannot be read.
     """
-    with open(path, 'r', encoding=encoding) as file:
-        return file.read()
+    # A single binary read skips the text layer; newlines are normalised the way
+    # universal newlines mode would do it.
+    content = _as_path(path).read_bytes().decode(encoding)
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
 
 
 def write_text_file(path: Union[str, Path], content: str, encoding: str = 'utf-8') -> None:
@@ -169,7 +208,7 @@ def get_file_extension(path: Union[str, Path]) -> str:
     Returns:
         str: The file extension (without the dot) or an empty string if there's no extension.
     """
-    return Path(path).suffix[1:]  # [1:] to remove the leading dot
+    return _as_path(path).suffix[1:]  # [1:] to remove the leading dot
 
 
 def get_file_stem(path: Union[str, Path]) -> str:
@@ -190,7 +229,7 @@ def get_file_stem(path: Union[str, Path]) -> str:
         >>> get_file_stem('image.with.multiple.dots.jpg')
         'image.with.multiple.dots'
     """
-    return Path(path).stem
+    return _as_path(path).stem
 
 
 def get_file_directory(path: Union[str, Path]) -> str:
@@ -211,12 +250,12 @@ def get_file_directory(path: Union[str, Path]) -> str:
         >>> get_file_directory('/home/user/documents/report.docx')
         '/home/user/documents'
     """
-    return str(Path(path).parent)
+    return str(_as_path(path).parent)
 
 
 def create_directory(path: Union[str, Path]) -> None:
     """Create a directory if it doesn't exist."""
-    Path(path).mkdir(parents=True, exist_ok=True)
+    _as_path(path).mkdir(parents=True, exist_ok=True)
 
 
 def delete_directory(path: Union[str, Path], recursive: bool = False) -> None:
@@ -231,7 +270,7 @@ def delete_directory(path: Union[str, Path], recursive: bool = False) -> None:
         FileNotFoundError: If the directory does not exist.
         OSError: If the directory cannot be deleted.
     """
-    dir_path = Path(path)
+    dir_path = _as_path(path)
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
     if recursive:
@@ -253,10 +292,11 @@ def list_directories(path: Union[str, Path]) -> List[str]:
     Raises:
         FileNotFoundError: If the directory does not exist.
     """
-    dir_path = Path(path)
+    dir_path = _as_path(path)
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
-    return [d.name for d in dir_path.iterdir() if d.is_dir()]
+    with os.scandir(dir_path) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
 
 
 def is_directory_empty(path: Union[str, Path]) -> bool:
@@ -272,10 +312,11 @@ def is_directory_empty(path: Union[str, Path]) -> bool:
     Raises:
         FileNotFoundError: If the directory does not exist.
     """
-    dir_path = Path(path)
+    dir_path = _as_path(path)
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
-    return not any(dir_path.iterdir())
+    with os.scandir(dir_path) as entries:
+        return next(entries, None) is None
 
 
 def copy_directory(src: Union[str, Path], dst: Union[str, Path]) -> None:
@@ -293,6 +334,52 @@ def copy_directory(src: Union[str, Path], dst: Union[str, Path]) -> None:
     shutil.copytree(src, dst)
 
 
+def copy_directory_fast(src: Union[str, Path], dst: Union[str, Path], workers: int = 8) -> None:
+    """
+    Copy a directory and its contents to a new location, copying files in parallel.
+
+    Directories are created while walking the source tree and the files are copied
+    by a thread pool with shutil.copyfile (sendfile on Linux). Only file contents are
+    copied; use copy_directory when permissions and timestamps must be preserved.
+    Symbolic links are recreated as links instead of being followed, like
+    shutil.copytree(symlinks=True), so linked trees are not copied and link loops
+    cannot recurse.
+
+    Args:
+        src (Union[str, Path]): The path of the source directory.
+        dst (Union[str, Path]): The path of the destination directory. It must not exist.
+        workers (int, optional): The maximum number of copy threads. Defaults to 8.
+
+    Raises:
+        FileNotFoundError: If the source directory does not exist.
+        FileExistsError: If the destination directory already exists.
+        OSError: If the directory cannot be copied.
+    """
+    if not os.path.isdir(src):
+        raise FileNotFoundError(f"Directory not found: {src}")
+    os.makedirs(dst)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        stack = [(os.fspath(src), os.fspath(dst))]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), target, target_is_directory=entry.is_dir())
+                    elif entry.is_dir(follow_symlinks=False):
+                        os.mkdir(target)
+                        stack.append((entry.path, target))
+                    else:
+                        futures.append(executor.submit(shutil.copyfile, entry.path, target))
+
+        # Re-raise the first failed copy, if any
+        for future in futures:
+            future.result()
+
+
 def move_directory(src: Union[str, Path], dst: Union[str, Path]) -> None:
     """
     Move a directory and its contents to a new location.
@@ -321,38 +408,158 @@ def get_directory_size(path: Union[str, Path]) -> int:
     Raises:
         FileNotFoundError: If the directory does not exist.
     """
-    dir_path = Path(path)
+    dir_path = _as_path(path)
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
-    return sum(f.stat().st_size for f in dir_path.glob('**/*') if f.is_file())
+    return _scandir_size(dir_path)
+
+
+def _scandir_size(path: Union[str, Path]) -> int:
+    """
+    Sum the sizes of all files below a directory.
+
+    Uses os.scandir so that the entry type and stat information cached on each
+    os.DirEntry are reused instead of issuing a fresh stat call per file. The
+    tree is walked with an explicit stack, so deep trees do not hit the
+    recursion limit.
+
+    Args:
+        path (Union[str, Path]): The directory to walk.
+
+    Returns:
+        int: The total size of the files in bytes.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Like os.walk, skip directories that cannot be read or vanished meanwhile
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
 
 
 def recursive_search(directory: Union[str, Path],
-                     filter_func: Callable[[Path], bool] = None) -> Iterator[Path]:
+                     filter_func: Callable[[os.DirEntry], bool] = None,
+                     as_path: bool = False) -> Iterator[Union[os.DirEntry, Path]]:
+    """
+    Recursively search a directory and yield the files that match the filter function.
+
+    The tree is walked with os.scandir, so filter functions receive os.DirEntry objects
+    and can use their cached type and stat information instead of querying the file
+    system again.
+
+    Args:
+        directory (Union[str, Path]): The directory to search.
+        filter_func (Callable[[os.DirEntry], bool], optional): A function that takes an
+            os.DirEntry object and returns True if the entry should be included in the results.
+            If None, all files are included. Defaults to None.
+        as_path (bool, optional): If True, yield Path objects instead of os.DirEntry objects.
+            Defaults to False.
+
+    Yields:
+        Iterator[Union[os.DirEntry, Path]]: An iterator of the entries that match the filter.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+    """
+    dir_path = _as_path(directory)
+    if not dir_path.exists():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+
+    yield from _scandir_search(str(dir_path), filter_func, as_path)
+
+
+def _scandir_search(top: str,
+                    filter_func: Callable[[os.DirEntry], bool],
+                    as_path: bool) -> Iterator[Union[os.DirEntry, Path]]:
     """
-    Recursively search a directory and yield paths that match the filter function.
+    Walk a directory tree with os.scandir and yield the files accepted by filter_func.
+
+    Args:
+        top (str): The directory to walk. Yielded paths are built by joining onto it.
+        filter_func (Callable[[os.DirEntry], bool]): The filter function, or None to accept all files.
+        as_path (bool): If True, yield Path objects instead of os.DirEntry objects.
+
+    Yields:
+        Iterator[Union[os.DirEntry, Path]]: An iterator of the entries that match the filter.
+    """
+    # Filters created by filter_by_extension are evaluated inline, without a call per entry
+    suffix = getattr(filter_func, '_dstone_suffix', None)
+
+    stack = [top]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Like os.walk, skip directories that cannot be read or vanished meanwhile
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, do not descend into symbolic links to directories
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                elif suffix is not None:
+                    if entry.name.lower().endswith(suffix):
+                        yield Path(entry.path) if as_path else entry
+                elif filter_func is None or filter_func(entry):
+                    yield Path(entry.path) if as_path else entry
+
+
+def recursive_search_parallel(directory: Union[str, Path],
+                              filter_func: Callable[[os.DirEntry], bool] = None,
+                              as_path: bool = False,
+                              max_workers: int = 8) -> Iterator[Union[os.DirEntry, Path]]:
+    """
+    Recursively search a directory using a thread pool, one task per top-level subdirectory.
+
+    Scanning and stat calls release the GIL, so for large trees (especially with filters
+    that stat every file, like filter_by_size) several subtrees can be walked concurrently.
+    Files directly in the directory are yielded first; the results of each subtree are
+    yielded as soon as it is completed, so the overall order is not deterministic.
 
     Args:
         directory (Union[str, Path]): The directory to search.
-        filter_func (Callable[[Path], bool], optional): A function that takes a Path object
-            and returns True if the path should be included in the results.
-            If None, all paths are included. Defaults to None.
+        filter_func (Callable[[os.DirEntry], bool], optional): A function that takes an
+            os.DirEntry object and returns True if the entry should be included in the results.
+            If None, all files are included. Defaults to None.
+        as_path (bool, optional): If True, yield Path objects instead of os.DirEntry objects.
+            Defaults to False.
+        max_workers (int, optional): The maximum number of worker threads. Defaults to 8.
 
     Yields:
-        Iterator[Path]: An iterator of Path objects that match the filter.
+        Iterator[Union[os.DirEntry, Path]]: An iterator of the entries that match the filter.
 
     Raises:
         FileNotFoundError: If the directory does not exist.
     """
-    dir_path = Path(directory)
+    dir_path = _as_path(directory)
     if not dir_path.exists():
         raise FileNotFoundError(f"Directory not found: {directory}")
 
-    for root, _, files in os.walk(dir_path):
-        for file in files:
-            file_path = Path(root) / file
-            if filter_func is None or filter_func(file_path):
-                yield file_path
+    subdirs = []
+    with os.scandir(str(dir_path)) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif filter_func is None or filter_func(entry):
+                yield Path(entry.path) if as_path else entry
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(list, _scandir_search(subdir, filter_func, as_path))
+                   for subdir in subdirs]
+        for future in as_completed(futures):
+            yield from future.result()
+
 
 # Existing functions (list_files, delete_file, copy_file, move_file, get_file_size,
 # read_text_file, write_text_file, get_file_extension) remain the same
@@ -360,20 +567,32 @@ def recursive_search(directory: Union[str, Path],
 # Example filter functions for recursive_search
 
 
-def filter_by_extension(extension: str) -> Callable[[Path], bool]:
+@functools.lru_cache(maxsize=128)
+def filter_by_extension(extension: str) -> Callable[[os.DirEntry], bool]:
     """
     Create a filter function that matches files with a specific extension.
 
+    Filters are cached per extension, so repeated calls with the same extension
+    return the same function object.
+
     Args:
         extension (str): The file extension to match (without the dot).
 
     Returns:
-        Callable[[Path], bool]: A filter function for use with recursive_search.
+        Callable[[os.DirEntry], bool]: A filter function for use with recursive_search.
+            The lowercased suffix is stored on it as '_dstone_suffix', which lets
+            recursive_search match it without calling the filter.
     """
-    return lambda path: path.suffix.lower() == f'.{extension.lower()}'
+    suffix = f'.{extension.lower()}'
+
+    def extension_filter(entry: os.DirEntry) -> bool:
+        return entry.name.lower().endswith(suffix)
+
+    extension_filter._dstone_suffix = suffix
+    return extension_filter
 
 
-def filter_by_name_pattern(pattern: str) -> Callable[[Path], bool]:
+def filter_by_name_pattern(pattern: str) -> Callable[[os.DirEntry], bool]:
     """
     Create a filter function that matches files using a glob-style pattern.
 
@@ -381,12 +600,14 @@ def filter_by_name_pattern(pattern: str) -> Callable[[Path], bool]:
         pattern (str): The glob-style pattern to match against file names.
 
     Returns:
-        Callable[[Path], bool]: A filter function for use with recursive_search.
+        Callable[[os.DirEntry], bool]: A filter function for use with recursive_search.
     """
-    return lambda path: fnmatch.fnmatch(path.name, pattern)
+    # Compile the pattern once instead of going through fnmatch on every entry
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    return lambda entry: regex.match(os.path.normcase(entry.name)) is not None
 
 
-def filter_by_size(min_size: int = None, max_size: int = None) -> Callable[[Path], bool]:
+def filter_by_size(min_size: int = None, max_size: int = None) -> Callable[[os.DirEntry], bool]:
     """
     Create a filter function that matches files within a specified size range.
 
@@ -395,10 +616,12 @@ def filter_by_size(min_size: int = None, max_size: int = None) -> Callable[[Path
         max_size (int, optional): Maximum file size in bytes. Defaults to None.
 
     Returns:
-        Callable[[Path], bool]: A filter function for use with recursive_search.
+        Callable[[os.DirEntry], bool]: A filter function for use with recursive_search.
+            It also accepts plain paths, which are stat'ed with os.stat.
     """
-    def size_filter(path: Path) -> bool:
-        size = path.stat().st_size
+    def size_filter(entry: Union[os.DirEntry, str, Path]) -> bool:
+        # DirEntry.stat() caches its result (and needs no syscall at all on Windows)
+        size = entry.stat().st_size if isinstance(entry, os.DirEntry) else os.stat(entry).st_size
         if min_size is not None and size < min_size:
             return False
         if max_size is not None and size > max_size:
@@ -7,6 +7,7 @@ endianness manipulations, and encoding/decoding operations.
 
 Functions:
     bytes_to_human_readable: Convert bytes to a human-readable string.
+    bytes_to_human_readable_array: Convert many byte values to human-readable strings (requires NumPy).
     human_readable_to_bytes: Convert a human-readable string to bytes.
     bits_to_human_readable: Convert bits to a human-readable string.
     bits_to_bytes: Convert bits to bytes.
@@ -18,6 +19,7 @@ Functions:
     seconds_to_human_readable: Convert seconds to a human-readable time string.
     little_endian_to_big_endian: Convert a little-endian byte string to big-endian.
     big_endian_to_little_endian: Convert a big-endian byte string to little-endian.
+    swap_word_endianness: Swap the byte order of every fixed-width word in a byte string.
     int_to_bytes: Convert an integer to a byte string.
     bytes_to_int: Convert a byte string to an integer.
     hex_to_bytes: Convert a hexadecimal string to bytes.
@@ -26,9 +28,37 @@ Functions:
     bytes_to_base64: Convert bytes to a base64 string.
 """
 
-import re
-from typing import Union
-import base64
+import bisect
+import functools
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+import binascii
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Upper-cased spellings accepted by human_readable_to_bytes, including binary units without
+# their trailing 'B' (e.g. '3Gi'), and the characters a size number may contain
+_SIZE_UNITS = {'B': 1, 'KIB': 1024, 'MIB': 1024**2, 'GIB': 1024**3, 'TIB': 1024**4, 'PIB': 1024**5,
+               'KI': 1024, 'MI': 1024**2, 'GI': 1024**3, 'TI': 1024**4, 'PI': 1024**5}
+_NUMBER_CHARS = frozenset('0123456789.')
+
+# Unit multipliers used by the binary/decimal prefix conversions
+_BINARY_PREFIXES = {'KiB': 1 << 10, 'MiB': 1 << 20, 'GiB': 1 << 30, 'TiB': 1 << 40, 'PiB': 1 << 50}
+_DECIMAL_PREFIXES = {'KB': 1000, 'MB': 1000**2, 'GB': 1000**3, 'TB': 1000**4, 'PB': 1000**5}
+
+# array typecodes by item size, used to byte swap packed fixed-width words
+_WORD_TYPECODES = {array(typecode).itemsize: typecode for typecode in 'QLIHB'}
+
+# Powers of 1000 used to pick and scale decimal units
+_DECIMAL_SCALES = (1.0, 1e3, 1e6, 1e9, 1e12, 1e15, 1e18)
+
+# Display units of the *_to_human_readable functions, from the base unit upwards
+_BYTE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB')
+_BIT_UNITS = ('bit', 'Kbit', 'Mbit', 'Gbit', 'Tbit', 'Pbit', 'Ebit')
+_BPS_UNITS = ('bit/s', 'Kbit/s', 'Mbit/s', 'Gbit/s', 'Tbit/s')
+_BYTES_PS_UNITS = ('B/s', 'KiB/s', 'MiB/s', 'GiB/s', 'TiB/s')
 
 
 def bytes_to_human_readable(bytes_value: Union[int, float]) -> str:
@@ -49,21 +79,71 @@ def bytes_to_human_readable(bytes_value: Union[int, float]) -> str:
         >>> bytes_to_human_readable(1048576)
         '1.00 MiB'
     """
-    units = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB']
     size = float(bytes_value)
-    unit_index = 0
+    # Negative and NaN values are shown in the base unit as well
+    if not size >= 1024.0:
+        return f"{size:.2f} {_BYTE_UNITS[0]}"
+
+    # Every unit is 2**10 times the previous one, so the bit length gives the unit directly
+    try:
+        unit_index = (int(size).bit_length() - 1) // 10
+    except OverflowError:
+        unit_index = len(_BYTE_UNITS) - 1
+    if unit_index > len(_BYTE_UNITS) - 1:
+        unit_index = len(_BYTE_UNITS) - 1
+
+    return f"{size / (1 << (unit_index * 10)):.2f} {_BYTE_UNITS[unit_index]}"
+
 
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+def bytes_to_human_readable_array(bytes_values: Iterable[Union[int, float]]) -> 'np.ndarray':
+    """
+    Convert many byte values to human-readable strings at once.
+
+    The unit of every value is computed with vectorized NumPy operations. The string
+    formatting runs per element, since NumPy's string operations cannot format a fixed
+    number of decimals. This requires NumPy, which is an optional dependency.
+
+    Args:
+        bytes_values (Iterable[Union[int, float]]): The values in bytes to convert,
+            e.g. a list or a NumPy array. A single value gives a one-element array and
+            multi-dimensional arrays are flattened.
+
+    Returns:
+        np.ndarray: A one-dimensional array of the human-readable strings (a NumPy str
+        dtype), formatted like bytes_to_human_readable.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+
+    Examples:
+        >>> bytes_to_human_readable_array([1023, 1024, 1048576]).tolist()
+        ['1023.00 B', '1.00 KiB', '1.00 MiB']
+    """
+    import numpy as np
 
-    return f"{size:.2f} {units[unit_index]}"
+    if isinstance(bytes_values, Iterator):
+        # NumPy cannot size an iterator, it would wrap it in a 0-d object array
+        bytes_values = list(bytes_values)
+    sizes = np.asarray(bytes_values, dtype=np.float64).reshape(-1)
 
+    # frexp gives floor(log2(size)) + 1 as the exponent, every unit spans 10 of them
+    unit_indices = np.clip((np.frexp(sizes)[1] - 1) // 10, 0, len(_BYTE_UNITS) - 1)
+    unit_indices[~(sizes >= 1024.0)] = 0
+    unit_indices[np.isposinf(sizes)] = len(_BYTE_UNITS) - 1
+    scaled = sizes / np.ldexp(1.0, unit_indices * 10)
 
+    return np.array([f"{size:.2f} {_BYTE_UNITS[unit_index]}"
+                     for size, unit_index in zip(scaled.tolist(), unit_indices.tolist())], dtype=str)
+
+
+@functools.lru_cache(maxsize=256)
 def human_readable_to_bytes(size_string: str) -> int:
     """
     Convert a human-readable string to bytes.
 
+    Results are cached, since the same few size strings (e.g. configuration values)
+    tend to be converted over and over.
+
     Args:
         size_string (str): A string representing a file size (e.g., '5.2 MiB', '3GiB').
 
@@ -79,15 +159,19 @@ def human_readable_to_bytes(size_string: str) -> int:
         >>> human_readable_to_bytes('3GiB')
         3221225472
     """
-    units = {'B': 1, 'KIB': 1024, 'MIB': 1024**2, 'GIB': 1024**3, 'TIB': 1024**4, 'PIB': 1024**5}
-    pattern = r'^\s*(\d+(?:\.\d+)?)\s*([BKMGTP]I?B?)\s*$'
-    match = re.match(pattern, size_string, re.IGNORECASE)
+    # Split '<number> <unit>' by hand, a regular expression is overkill for this grammar
+    text = size_string.strip().upper()
+    end = 0
+    while end < len(text) and text[end] in _NUMBER_CHARS:
+        end += 1
+    size = text[:end]
+    multiplier = _SIZE_UNITS.get(text[end:].lstrip())
 
-    if not match:
+    valid_size = size and size.count('.') <= 1 and size[0] != '.' and size[-1] != '.'
+    if multiplier is None or not valid_size:
         raise ValueError("Invalid size string format")
 
-    size, unit = match.groups()
-    return int(float(size) * units[unit.upper()])
+    return int(float(size) * multiplier)
 
 
 def bits_to_human_readable(bits_value: Union[int, float]) -> str:
@@ -108,15 +192,16 @@ def bits_to_human_readable(bits_value: Union[int, float]) -> str:
         >>> bits_to_human_readable(1000000000)
         '1.00 Gbit'
     """
-    units = ['bit', 'Kbit', 'Mbit', 'Gbit', 'Tbit', 'Pbit', 'Ebit']
     size = float(bits_value)
-    unit_index = 0
+    # Negative and NaN values are shown in the base unit as well
+    if not size >= 1000.0:
+        return f"{size:.2f} {_BIT_UNITS[0]}"
 
-    while size >= 1000.0 and unit_index < len(units) - 1:
-        size /= 1000.0
-        unit_index += 1
+    unit_index = bisect.bisect_right(_DECIMAL_SCALES, size) - 1
+    if unit_index > len(_BIT_UNITS) - 1:
+        unit_index = len(_BIT_UNITS) - 1
 
-    return f"{size:.2f} {units[unit_index]}"
+    return f"{size / _DECIMAL_SCALES[unit_index]:.2f} {_BIT_UNITS[unit_index]}"
 
 
 def bits_to_bytes(bits: Union[int, float]) -> float:
@@ -178,14 +263,11 @@ def binary_prefix_to_decimal_prefix(value: float, from_unit: str, to_unit: str)
         >>> binary_prefix_to_decimal_prefix(1, 'GiB', 'GB')
         1.073741824
     """
-    binary_prefixes = {'KiB': 1024, 'MiB': 1024**2, 'GiB': 1024**3, 'TiB': 1024**4, 'PiB': 1024**5}
-    decimal_prefixes = {'KB': 1000, 'MB': 1000**2, 'GB': 1000**3, 'TB': 1000**4, 'PB': 1000**5}
-
-    if from_unit not in binary_prefixes or to_unit not in decimal_prefixes:
+    if from_unit not in _BINARY_PREFIXES or to_unit not in _DECIMAL_PREFIXES:
         raise ValueError("Invalid unit prefixes")
 
-    binary_value = value * binary_prefixes[from_unit]
-    return binary_value / decimal_prefixes[to_unit]
+    binary_value = value * _BINARY_PREFIXES[from_unit]
+    return binary_value / _DECIMAL_PREFIXES[to_unit]
 
 
 def decimal_prefix_to_binary_prefix(value: float, from_unit: str, to_unit: str) -> float:
@@ -209,14 +291,11 @@ def decimal_prefix_to_binary_prefix(value: float, from_unit: str, to_unit: str)
         >>> decimal_prefix_to_binary_prefix(1, 'GB', 'GiB')
         0.9313225746154785
     """
-    binary_prefixes = {'KiB': 1024, 'MiB': 1024**2, 'GiB': 1024**3, 'TiB': 1024**4, 'PiB': 1024**5}
-    decimal_prefixes = {'KB': 1000, 'MB': 1000**2, 'GB': 1000**3, 'TB': 1000**4, 'PB': 1000**5}
-
-    if from_unit not in decimal_prefixes or to_unit not in binary_prefixes:
+    if from_unit not in _DECIMAL_PREFIXES or to_unit not in _BINARY_PREFIXES:
         raise ValueError("Invalid unit prefixes")
 
-    decimal_value = value * decimal_prefixes[from_unit]
-    return decimal_value / binary_prefixes[to_unit]
+    decimal_value = value * _DECIMAL_PREFIXES[from_unit]
+    return decimal_value / _BINARY_PREFIXES[to_unit]
 
 
 def bits_per_second_to_human_readable(bps: Union[int, float]) -> str:
@@ -235,15 +314,16 @@ def bits_per_second_to_human_readable(bps: Union[int, float]) -> str:
         >>> bits_per_second_to_human_readable(1500000)
         '1.50 Mbit/s'
     """
-    units = ['bit/s', 'Kbit/s', 'Mbit/s', 'Gbit/s', 'Tbit/s']
     size = float(bps)
-    unit_index = 0
+    # Negative and NaN values are shown in the base unit as well
+    if not size >= 1000.0:
+        return f"{size:.2f} {_BPS_UNITS[0]}"
 
-    while size >= 1000.0 and unit_index < len(units) - 1:
-        size /= 1000.0
-        unit_index += 1
+    unit_index = bisect.bisect_right(_DECIMAL_SCALES, size) - 1
+    if unit_index > len(_BPS_UNITS) - 1:
+        unit_index = len(_BPS_UNITS) - 1
 
-    return f"{size:.2f} {units[unit_index]}"
+    return f"{size / _DECIMAL_SCALES[unit_index]:.2f} {_BPS_UNITS[unit_index]}"
 
 
 def bytes_per_second_to_human_readable(bps: Union[int, float]) -> str:
@@ -262,21 +342,28 @@ def bytes_per_second_to_human_readable(bps: Union[int, float]) -> str:
         >>> bytes_per_second_to_human_readable(1572864)
         '1.50 MiB/s'
     """
-    units = ['B/s', 'KiB/s', 'MiB/s', 'GiB/s', 'TiB/s']
     size = float(bps)
-    unit_index = 0
+    # Negative and NaN values are shown in the base unit as well
+    if not size >= 1024.0:
+        return f"{size:.2f} {_BYTES_PS_UNITS[0]}"
 
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    # Every unit is 2**10 times the previous one, so the bit length gives the unit directly
+    try:
+        unit_index = (int(size).bit_length() - 1) // 10
+    except OverflowError:
+        unit_index = len(_BYTES_PS_UNITS) - 1
+    if unit_index > len(_BYTES_PS_UNITS) - 1:
+        unit_index = len(_BYTES_PS_UNITS) - 1
 
-    return f"{size:.2f} {units[unit_index]}"
+    return f"{size / (1 << (unit_index * 10)):.2f} {_BYTES_PS_UNITS[unit_index]}"
 
 
 def seconds_to_human_readable(seconds: Union[int, float]) -> str:
     """
     Convert seconds to a human-readable time string.
 
+    Fractions of a second are dropped.
+
     Args:
         seconds (Union[int, float]): The number of seconds to convert.
 
@@ -289,22 +376,24 @@ def seconds_to_human_readable(seconds: Union[int, float]) -> str:
         >>> seconds_to_human_readable(86400)
         '1 day'
     """
-    intervals = [
-        (60 * 60 * 24, 'day'),
-        (60 * 60, 'hour'),
-        (60, 'minute'),
-        (1, 'second')
-    ]
+    seconds = int(seconds)
+    days = seconds // (60 * 60 * 24)
+    seconds -= days * (60 * 60 * 24)
+    hours = seconds // (60 * 60)
+    seconds -= hours * (60 * 60)
+    minutes = seconds // 60
+    seconds -= minutes * 60
 
+    # Unrolled on purpose, this is cheaper than looping over (value, name) pairs
     result = []
-    for count, name in intervals:
-        value = seconds // count
-        if value:
-            seconds -= value * count
-            if value == 1:
-                result.append(f"{value} {name}")
-            else:
-                result.append(f"{value} {name}s")
+    if days:
+        result.append(f"{days} day" if days == 1 else f"{days} days")
+    if hours:
+        result.append(f"{hours} hour" if hours == 1 else f"{hours} hours")
+    if minutes:
+        result.append(f"{minutes} minute" if minutes == 1 else f"{minutes} minutes")
+    if seconds:
+        result.append(f"{seconds} second" if seconds == 1 else f"{seconds} seconds")
     return ', '.join(result)
 
 
@@ -342,6 +431,37 @@ def big_endian_to_little_endian(byte_string: bytes) -> bytes:
     return byte_string[::-1]
 
 
+def swap_word_endianness(byte_string: bytes, width: int) -> bytes:
+    """
+    Swap the byte order of every fixed-width word in a packed byte string.
+
+    This is the bulk counterpart of little_endian_to_big_endian: a buffer of
+    packed 2, 4 or 8 byte integers is converted in a single C-level pass with
+    array.byteswap instead of reversing each word in Python.
+
+    Args:
+        byte_string (bytes): The packed words to convert.
+        width (int): The size of each word in bytes (1, 2, 4 or 8).
+
+    Returns:
+        bytes: The words with their byte order swapped.
+
+    Raises:
+        ValueError: If the width is not supported or the length is not a multiple of it.
+
+    Examples:
+        >>> swap_word_endianness(b'\x01\x00\x02\x00', 2)
+        b'\x00\x01\x00\x02'
+    """
+    typecode = _WORD_TYPECODES.get(width)
+    if typecode is None or len(byte_string) % width:
+        raise ValueError("Invalid word width")
+
+    words = array(typecode, byte_string)
+    words.byteswap()
+    return words.tobytes()
+
+
 def int_to_bytes(x: int, length: int = None, byteorder: str = 'big') -> bytes:
     """
     Convert an integer to a byte string.
@@ -349,7 +469,7 @@ def int_to_bytes(x: int, length: int = None, byteorder: str = 'big') -> bytes:
     Args:
         x (int): The integer to convert.
         length (int, optional): The length of the resulting byte string. If None,
-                                the minimum number of bytes required is used.
+                                the minimum number of bytes required is used (at least one).
         byteorder (str, optional): The byte order: 'big' or 'little'. Defaults to 'big'.
 
     Returns:
@@ -360,10 +480,12 @@ def int_to_bytes(x: int, length: int = None, byteorder: str = 'big') -> bytes:
         b'\x01\x02'
         >>> int_to_bytes(258, length=4, byteorder='little')
         b'\x02\x01\x00\x00'
+        >>> int_to_bytes(0)
+        b'\x00'
     """
     if length is None:
-        length = (x.bit_length() + 7) // 8
-    return x.to_bytes(length, byteorder=byteorder)
+        length = (x.bit_length() + 7) >> 3 or 1
+    return x.to_bytes(length, byteorder)
 
 
 def bytes_to_int(byte_string: bytes, byteorder: str = 'big') -> int:
@@ -383,7 +505,7 @@ def bytes_to_int(byte_string: bytes, byteorder: str = 'big') -> int:
         >>> bytes_to_int(b'\x02\x01\x00\x00', byteorder='little')
         258
     """
-    return int.from_bytes(byte_string, byteorder=byteorder)
+    return int.from_bytes(byte_string, byteorder)
 
 
 def hex_to_bytes(hex_string: str) -> bytes:
@@ -450,8 +572,8 @@ def base64_to_bytes(base64_string: str) -> bytes:
         b'\x01\x02\x03\x04\x05'
     """
     try:
-        return base64.b64decode(base64_string)
-    except base64.binascii.Error:
+        return binascii.a2b_base64(base64_string)
+    except binascii.Error:
         raise ValueError("Invalid base64 string")
 
 
@@ -471,7 +593,7 @@ def bytes_to_base64(byte_string: bytes) -> str:
         >>> bytes_to_base64(b'\x01\x02\x03\x04\x05')
         'AQIDBAU='
     """
-    return base64.b64encode(byte_string).decode()
+    return binascii.b2a_base64(byte_string, newline=False).decode('ascii')
 
 
 # Example usage
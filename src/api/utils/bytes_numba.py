@@ -0,0 +1,199 @@
+"""
+Numba Bytes Utility Module
+
+This module provides Numba-compiled versions of the arithmetic helpers of the bytes
+utility module. They are meant for numeric inner loops (telemetry, plotting) and for
+calls from other @njit functions, where the Python call overhead disappears entirely.
+
+The functions keep the signatures of their counterparts in src.api.utils.bytes, so
+callers can swap them in when Numba is available:
+
+    try:
+        from src.api.utils.bytes_numba import bits_to_bytes
+    except ImportError:
+        from src.api.utils.bytes import bits_to_bytes
+
+This module requires Numba and NumPy, which are optional dependencies.
+
+Functions:
+    bits_to_bytes: Convert bits to bytes.
+    bytes_to_bits: Convert bytes to bits.
+    binary_prefix_to_decimal_prefix: Convert a value from a binary prefix to a decimal prefix.
+    decimal_prefix_to_binary_prefix: Convert a value from a decimal prefix to a binary prefix.
+    bytes_to_human_index: Get the index of the binary unit a byte value should be displayed with.
+    bytes_to_human_readable_batch: Scale an array of byte values to their binary units.
+"""
+
+# Python Imports
+from typing import Tuple
+
+# Library Imports
+import numpy as np
+from numba import njit
+
+
+# Largest unit index, matching ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB']
+_LAST_BYTE_UNIT = 6
+
+
+@njit(cache=True)
+def bits_to_bytes(bits: float) -> float:
+    """
+    Convert bits to bytes.
+
+    Args:
+        bits (float): The number of bits to convert.
+
+    Returns:
+        float: The equivalent number of bytes.
+    """
+    return bits / 8
+
+
+@njit(cache=True)
+def bytes_to_bits(bytes_value: float) -> float:
+    """
+    Convert bytes to bits.
+
+    Args:
+        bytes_value (float): The number of bytes to convert.
+
+    Returns:
+        float: The equivalent number of bits.
+    """
+    return bytes_value * 8
+
+
+@njit(cache=True)
+def _binary_prefix_factor(unit: str) -> float:
+    """
+    Get the multiplier of a binary prefix unit, or 0.0 if the unit is unknown.
+    """
+    if unit == 'KiB':
+        return 1024.0
+    if unit == 'MiB':
+        return 1024.0 ** 2
+    if unit == 'GiB':
+        return 1024.0 ** 3
+    if unit == 'TiB':
+        return 1024.0 ** 4
+    if unit == 'PiB':
+        return 1024.0 ** 5
+    return 0.0
+
+
+@njit(cache=True)
+def _decimal_prefix_factor(unit: str) -> float:
+    """
+    Get the multiplier of a decimal prefix unit, or 0.0 if the unit is unknown.
+    """
+    if unit == 'KB':
+        return 1e3
+    if unit == 'MB':
+        return 1e6
+    if unit == 'GB':
+        return 1e9
+    if unit == 'TB':
+        return 1e12
+    if unit == 'PB':
+        return 1e15
+    return 0.0
+
+
+@njit(cache=True)
+def binary_prefix_to_decimal_prefix(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convert a value from a binary prefix to a decimal prefix.
+
+    Args:
+        value (float): The value to convert.
+        from_unit (str): The binary prefix unit (e.g., 'MiB', 'GiB').
+        to_unit (str): The decimal prefix unit (e.g., 'MB', 'GB').
+
+    Returns:
+        float: The converted value.
+
+    Raises:
+        ValueError: If the unit prefixes are invalid.
+    """
+    from_factor = _binary_prefix_factor(from_unit)
+    to_factor = _decimal_prefix_factor(to_unit)
+    if from_factor == 0.0 or to_factor == 0.0:
+        raise ValueError("Invalid unit prefixes")
+    return value * from_factor / to_factor
+
+
+@njit(cache=True)
+def decimal_prefix_to_binary_prefix(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convert a value from a decimal prefix to a binary prefix.
+
+    Args:
+        value (float): The value to convert.
+        from_unit (str): The decimal prefix unit (e.g., 'MB', 'GB').
+        to_unit (str): The binary prefix unit (e.g., 'MiB', 'GiB').
+
+    Returns:
+        float: The converted value.
+
+    Raises:
+        ValueError: If the unit prefixes are invalid.
+    """
+    from_factor = _decimal_prefix_factor(from_unit)
+    to_factor = _binary_prefix_factor(to_unit)
+    if from_factor == 0.0 or to_factor == 0.0:
+        raise ValueError("Invalid unit prefixes")
+    return value * from_factor / to_factor
+
+
+@njit(cache=True)
+def bytes_to_human_index(bytes_value: float) -> int:
+    """
+    Get the index of the binary unit ('B', 'KiB', ..., 'EiB') a byte value should be displayed with.
+
+    Args:
+        bytes_value (float): The value in bytes. Python integers beyond the int64 range
+            are rejected with a TypingError; convert them to float first.
+
+    Returns:
+        int: The unit index, between 0 and 6.
+    """
+    # Explicit loops are what Numba compiles best; int.bit_length is not supported
+    unit_index = 0
+    while bytes_value >= 1024.0 and unit_index < _LAST_BYTE_UNIT:
+        bytes_value /= 1024.0
+        unit_index += 1
+    return unit_index
+
+
+@njit(cache=True)
+def bytes_to_human_readable_batch(bytes_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scale an array of byte values to the binary units they should be displayed with.
+
+    Numba cannot format strings, so this returns the scaled values and the unit indices;
+    formatting them gives the output of bytes_to_human_readable:
+
+        sizes, indices = bytes_to_human_readable_batch(values)
+        units = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB', 'EiB']
+        strings = [f"{size:.2f} {units[index]}" for size, index in zip(sizes, indices)]
+
+    Args:
+        bytes_values (np.ndarray): The values in bytes, as an array of a numeric dtype.
+            Multi-dimensional arrays are flattened in C order. Integers beyond the int64
+            (or uint64) range only fit into object arrays, which Numba rejects with a
+            TypingError; convert such values to float64 first.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The scaled values (float64) and unit indices (int64),
+        both one-dimensional.
+    """
+    values = bytes_values.ravel()
+    sizes = np.empty(values.shape[0], dtype=np.float64)
+    unit_indices = np.empty(values.shape[0], dtype=np.int64)
+    for i in range(values.shape[0]):
+        size = float(values[i])
+        unit_index = bytes_to_human_index(size)
+        sizes[i] = size / 1024.0 ** unit_index
+        unit_indices[i] = unit_index
+    return sizes, unit_indices
@@ -30,12 +30,70 @@ while allowing for plugin-specific customizations.
 
 For advanced use cases, such as distributed systems or custom logging requirements,
 additional handlers can be added to the main logger configuration.
+
+Log messages are passed as %-style format strings with separate arguments, e.g.
+logger.info("Loaded plugin: %s", name), never as f-strings: the message is then only
+built if the record is actually emitted.
+
+The handlers of the main logger do not run on the logging thread: records are put on
+a queue and written by a background QueueListener, which is stopped (and drained)
+at interpreter exit.
 """
 
 # Python Imports
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional, List
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Dict, Optional, List
+
+
+# Shared by every handler configured in this module
+_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+# Background listener feeding the main logger's handlers, set by configure_main_logger
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """
+    Stop the background listener of the main logger, writing out any queued records.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# Registered after logging's own shutdown hook, so it runs before the handlers are closed
+atexit.register(_stop_listener)
+
+# Buffered plugin log file handlers, keyed by absolute file path
+_plugin_file_handlers: Dict[str, MemoryHandler] = {}
+
+
+def _get_plugin_file_handler(log_file: str) -> MemoryHandler:
+    """
+    Get the buffered handler writing to a plugin log file, creating it on first use.
+
+    Records are written out in batches of 256, or as soon as an error is logged.
+
+    Args:
+        log_file (str): The path to the log file.
+
+    Returns:
+        MemoryHandler: The handler for the log file.
+    """
+    key = os.path.abspath(log_file)
+    handler = _plugin_file_handlers.get(key)
+    if handler is None:
+        file_handler = logging.FileHandler(key)
+        file_handler.setFormatter(_FORMATTER)
+        handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=file_handler)
+        _plugin_file_handlers[key] = handler
+    return handler
 
 
 def configure_main_logger(
@@ -49,6 +107,8 @@ def configure_main_logger(
 
     This function sets up logging handlers based on the provided parameters.
     It can log to a file, to stdout, or both, and allows for additional custom handlers.
+    The handlers are driven by a background QueueListener, so logging calls only
+    enqueue records and never wait on file or console I/O.
 
     Args:
         log_level (str): The logging level (e.g., 'INFO', 'DEBUG', 'WARNING').
@@ -62,6 +122,8 @@ def configure_main_logger(
     Raises:
         ValueError: If an invalid log level is provided.
     """
+    global _listener
+
     # Validate and set the log level
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
@@ -70,37 +132,55 @@ def configure_main_logger(
     # Get the root logger
     logger = logging.getLogger()
 
-    # Remove all existing handlers to prevent duplicate logging
+    # Remove all existing handlers to prevent duplicate logging. The listener is stopped
+    # first, so the records still queued are written before its handlers are closed;
+    # handlers passed in again are kept open
+    replaced = list(logger.handlers)
+    if _listener is not None:
+        replaced.extend(_listener.handlers)
+    _stop_listener()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    reused = set(additional_handlers or ())
+    for handler in replaced:
+        if handler not in reused:
+            handler.close()
 
     # Set the log level
     logger.setLevel(numeric_level)
 
-    # Create formatter
-    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    handlers = []
 
     # Configure file logging if a log file is provided
     if log_file is not None:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
 
     # Configure stdout logging if enabled
     if log_to_stdout:
         stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+        stream_handler.setFormatter(_FORMATTER)
+        handlers.append(stream_handler)
 
     # Add any additional handlers
     if additional_handlers:
+        # Handlers compare by identity, so a set skips duplicates without rescanning the list
+        seen = set(handlers)
         for handler in additional_handlers:
-            if handler not in logger.handlers:
-                handler.setFormatter(formatter)
-                logger.addHandler(handler)
+            if handler not in seen:
+                handler.setFormatter(_FORMATTER)
+                handlers.append(handler)
+                seen.add(handler)
+
+    # The handlers run on the listener thread, the root logger only enqueues records
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     # Log the configured log level
-    logger.info(f"Main logger configured with level: {log_level}")
+    logger.info("Main logger configured with level: %s", log_level)
 
 
 def get_plugin_logger(plugin_name: str, log_file: Optional[str] = None) -> logging.Logger:
@@ -108,7 +188,9 @@ def get_plugin_logger(plugin_name: str, log_file: Optional[str] = None) -> loggi
     Create a logger for a specific plugin.
 
     This function creates a logger that will log to both the main application log
-    and a plugin-specific log file if specified.
+    and a plugin-specific log file if specified. Writes to the plugin log file are
+    buffered, and calling this again for the same plugin and file (e.g. on reload)
+    does not add a second handler.
 
     Args:
         plugin_name (str): The name of the plugin.
@@ -120,10 +202,9 @@ def get_plugin_logger(plugin_name: str, log_file: Optional[str] = None) -> loggi
     logger = logging.getLogger(plugin_name)
 
     if log_file:
-        file_handler = logging.FileHandler(log_file)
-        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler = _get_plugin_file_handler(log_file)
+        if file_handler not in logger.handlers:
+            logger.addHandler(file_handler)
 
     logger.info("Plugin logger configured")
 
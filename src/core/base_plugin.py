@@ -7,21 +7,129 @@ in the DStone application. It provides a streamlined interface for plugin develo
 """
 
 # Python Imports
+import sys
+import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Callable
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, NamedTuple, Optional, Callable, Tuple
 
 # Local Imports
 from src.api.utils.logging import get_plugin_logger
 
 
-@dataclass
+# Results of the _validation_schema check, keyed by plugin class and frozen configuration,
+# least recently used first; only the most recent _VALIDATED_CONFIGS_SIZE results are kept
+_VALIDATED_CONFIGS_SIZE = 256
+_validated_configs: OrderedDict[Tuple[type, Any], bool] = OrderedDict()
+
+
+def _freeze_config(value: Any) -> Any:
+    """
+    Turn a configuration value into a hashable equivalent, recursing into containers.
+
+    Args:
+        value (Any): The configuration value to freeze.
+
+    Returns:
+        Any: A hashable representation of the value.
+    """
+    # Keep the type, so that e.g. 1 and True or [1] and (1,) are validated separately
+    if isinstance(value, dict):
+        return type(value), frozenset((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze_config(item) for item in value)
+    return type(value), value
+
+
+def _check_schema(plugin_class: type, config: Dict[str, Any]) -> bool:
+    """
+    Check a configuration against the _validation_schema of a plugin class, reusing recent
+    results for the same class and configuration.
+
+    Args:
+        plugin_class (type): The plugin class whose schema applies.
+        config (Dict[str, Any]): Configuration dictionary to check.
+
+    Returns:
+        bool: True if the configuration matches the schema, False otherwise.
+    """
+    try:
+        key = (plugin_class, _freeze_config(config))
+        valid = _validated_configs[key]
+        _validated_configs.move_to_end(key)
+        return valid
+    except TypeError:
+        # Values that cannot be hashed are checked every time
+        key = None
+    except KeyError:
+        pass
+
+    valid = True
+    for name, expected_type, required in plugin_class._validation_schema:
+        if name not in config:
+            if required:
+                valid = False
+                break
+        elif not isinstance(config[name], expected_type):
+            valid = False
+            break
+
+    if key is not None:
+        _validated_configs[key] = valid
+        if len(_validated_configs) > _VALIDATED_CONFIGS_SIZE:
+            _validated_configs.popitem(last=False)
+    return valid
+
+
+def _validate_config(plugin: 'BasePlugin', config: Dict[str, Any]) -> bool:
+    """
+    Validate a configuration against the plugin's schema and validate_config.
+
+    Only the schema check is cached; validate_config runs for every plugin instance, since
+    it may depend on the instance or have side effects.
+
+    Args:
+        plugin (BasePlugin): The plugin the configuration is meant for.
+        config (Dict[str, Any]): Configuration dictionary to validate.
+
+    Returns:
+        bool: True if the configuration is valid, False otherwise.
+    """
+    return _check_schema(type(plugin), config) and bool(plugin.validate_config(config))
+
+
+# The fields get_info reports; BasePlugin.__setattr__ keeps their copies in _info current
+_INFO_FIELDS = frozenset(("name", "version", "description", "aliases", "priority", "dependencies",
+                          "sessionable", "initialized"))
+
+
+class PluginMeta(NamedTuple):
+    """
+    Registration metadata of a plugin class, resolved once when the class is defined.
+
+    Attributes:
+        version (str): The version the plugin is registered with.
+        description (str): The description the plugin is registered with.
+    """
+
+    version: str
+    description: str
+
+
+@dataclass(slots=True)
 class BasePlugin(ABC):
     """
     A base class for plugins in the DStone application.
 
     This class provides a foundation for creating plugins with common attributes and methods.
-    It uses the dataclass decorator for automatic generation of __repr__ and __eq__ methods.
+    It uses the dataclass decorator for automatic generation of __init__, __repr__ and __eq__
+    methods.
+    The attributes are stored in __slots__, so plugin instances carry no per-instance
+    __dict__ unless a subclass adds one.
 
     Attributes:
         name (str): The name of the plugin.
@@ -33,6 +141,7 @@ class BasePlugin(ABC):
         dependencies (List[str]): Names of other plugins this plugin depends on.
         sessionable (bool): Whether the plugin can maintain session state.
         initialized (bool): Whether the plugin has been initialized.
+        logger (logging.Logger): The logger of the plugin, set up on first access.
     """
 
     name: str
@@ -43,39 +152,105 @@ class BasePlugin(ABC):
     priority: int = 0
     dependencies: List[str] = field(default_factory=list)
     sessionable: bool = False
-    initialized: bool = False
+    initialized: bool = field(default=False, init=False)
+    _logger: Optional[logging.Logger] = field(default=None, init=False, repr=False, compare=False)
+    _info: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _info_view: Optional[Mapping[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _last_epoch: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # Every subclass, keyed by '<module>.<qualname>', registered as soon as its module is imported
+    _subclasses: ClassVar[Dict[str, type]] = {}
+    _meta: ClassVar[PluginMeta]
+
+    # (key, type, required) entries checked before validate_config, subclasses override this
+    _validation_schema: ClassVar[Tuple[Tuple[str, type, bool], ...]] = ()
 
-    def __init__(self,
-                 name: str,
-                 version: str,
-                 description: str,
-                 app: Any,
-                 aliases: List[str] = None,
-                 priority: int = 0,
-                 dependencies: List[str] = None,
-                 sessionable: bool = False):
+    # Plugins whose execute() gives the same result while the plugin set is unchanged set this,
+    # DStone then skips re-executing them until another plugin is registered
+    idempotent: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any):
         """
-        Initialize the plugin.
+        Register a plugin class and resolve its metadata when it is defined.
 
         Args:
-            name (str): The name of the plugin.
-            version (str): The version of the plugin.
-            description (str): A brief description of the plugin's purpose.
-            app (Any): The main application object, providing access to shared resources.
-            aliases (List[str], optional): Alternative names for the plugin.
-            priority (int, optional): The priority of the plugin in the system.
-            dependencies (List[str], optional): Names of other plugins this plugin depends on.
-            sessionable (bool, optional): Whether the plugin can maintain session state.
+            **kwargs: Arbitrary keyword arguments passed on to the parent class.
+        """
+        # Zero-argument super() would see the class dataclass(slots=True) replaced
+        super(BasePlugin, cls).__init_subclass__(**kwargs)
+        # Keyed by name, so a class recreated by a decorator replaces its first version
+        BasePlugin._subclasses[f"{cls.__module__}.{cls.__qualname__}"] = cls
+
+        # A class attribute shadows the slot of a field, which only an instance __dict__ can
+        # make up for; without one, create() would fail with a read-only attribute error
+        if not cls.__dictoffset__:
+            shadowed = [name for name in BasePlugin.__dataclass_fields__ if name in cls.__dict__]
+            if shadowed:
+                raise TypeError(f"Plugin class {cls.__qualname__} declares __slots__ and sets the field(s) "
+                                f"{', '.join(shadowed)} as class attributes; drop __slots__ from the class")
+
+        # Slotted fields appear on the class as member descriptors, only take plain string values
+        version = getattr(cls, 'version', None)
+        if not isinstance(version, str):
+            version = '0.1'
+        description = getattr(cls, 'description', None)
+        if not isinstance(description, str):
+            description = 'No description provided'
+        cls._meta = PluginMeta(version=version, description=description)
+
+    def __post_init__(self):
+        """
+        Finish initializing the plugin once the dataclass __init__ has set the fields.
+
+        create() and subclasses pass None for the aliases and dependencies they leave out,
+        these are replaced with fresh lists. The name and the names in both lists are
+        interned, since DStone uses them as keys for every dependency lookup.
+        """
+        self.name = sys.intern(self.name)
+        self.aliases = [sys.intern(alias) for alias in self.aliases or ()]
+        self.dependencies = [sys.intern(dependency) for dependency in self.dependencies or ()]
+        self._info = {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "aliases": self.aliases,
+            "priority": self.priority,
+            "dependencies": self.dependencies,
+            "sessionable": self.sessionable,
+            "initialized": self.initialized
+        }
+        self._info_view = MappingProxyType(self._info)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute, mirroring the fields reported by get_info into its mapping.
+
+        Args:
+            name (str): The name of the attribute.
+            value (Any): The new value.
         """
-        self.name = name
-        self.version = version
-        self.description = description
-        self.app = app
-        self.aliases = aliases or []
-        self.priority = priority
-        self.dependencies = dependencies or []
-        self.sessionable = sessionable
-        self.logger = get_plugin_logger(self.name)
+        super(BasePlugin, self).__setattr__(name, value)
+        if name in _INFO_FIELDS:
+            # The dataclass __init__ sets the fields before _info exists
+            info = getattr(self, '_info', None)
+            if info is not None:
+                info[name] = value
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        The logger of the plugin, set up on first access so idle plugins never configure one.
+        """
+        if self._logger is None:
+            self._logger = get_plugin_logger(self.name)
+        return self._logger
+
+    @logger.setter
+    def logger(self, logger: logging.Logger) -> None:
+        """
+        Replace the logger of the plugin, e.g. with one set up by the plugin itself.
+        """
+        self._logger = logger
 
     @abstractmethod
     def execute(self, *args: Any, **kwargs: Any) -> Any:
@@ -99,41 +274,43 @@ class BasePlugin(ABC):
         """
         pass
 
-    def attach(self, on_attach: Callable[[], None]) -> None:
+    @staticmethod
+    def attach(on_attach: Callable[[], None]) -> None:
         """
         Attach the plugin to the application.
 
+        This only invokes the callback and needs no instance, so it is a static method;
+        callers that hold the callback can just as well call it directly.
+
         Args:
             on_attach (Callable[[], None]): Callback function to be called when the plugin is attached.
         """
         on_attach()
 
-    def detach(self, on_detach: Callable[[], None]) -> None:
+    @staticmethod
+    def detach(on_detach: Callable[[], None]) -> None:
         """
         Detach the plugin from the application.
 
+        Like attach, this only invokes the callback.
+
         Args:
             on_detach (Callable[[], None]): Callback function to be called when the plugin is detached.
         """
         on_detach()
 
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> Mapping[str, Any]:
         """
         Return basic information about the plugin.
 
+        The information is built once when the plugin is created and kept up to date as
+        the fields change, so it is returned as a read-only view without copying. Callers
+        that need a mutable copy can use dict(plugin.get_info()).
+
         Returns:
-            Dict[str, Any]: A dictionary containing plugin information.
+            Mapping[str, Any]: A read-only mapping containing plugin information.
         """
-        return {
-            "name": self.name,
-            "version": self.version,
-            "description": self.description,
-            "aliases": self.aliases,
-            "priority": self.priority,
-            "dependencies": self.dependencies,
-            "sessionable": self.sessionable,
-            "initialized": self.initialized
-        }
+        return self._info_view
 
     @abstractmethod
     def validate_config(self, config: Dict[str, Any]) -> bool:
@@ -162,6 +339,9 @@ class BasePlugin(ABC):
         """
         Factory method to create and initialize a plugin instance.
 
+        A configuration, if given, is checked against _validation_schema and validate_config;
+        the outcome of the schema check is cached per plugin class and configuration.
+
         Args:
             name (str): The name of the plugin.
             version (str): The version of the plugin.
@@ -175,15 +355,20 @@ class BasePlugin(ABC):
 
         Returns:
             BasePlugin: An instance of the plugin.
+
+        Raises:
+            ValueError: If the configuration is invalid.
         """
-        plugin = cls(name,
-                     version,
-                     description,
-                     app, aliases,
-                     priority,
-                     dependencies,
-                     sessionable)
-        if config and plugin.validate_config(config):
-            # Apply configuration if provided and valid
-            pass  # TODO: Apply configuration
+        plugin = cls(name=name,
+                     version=version,
+                     description=description,
+                     app=app,
+                     aliases=aliases,
+                     priority=priority,
+                     dependencies=dependencies,
+                     sessionable=sessionable)
+        if config is not None:
+            if not _validate_config(plugin, config):
+                raise ValueError(f"Invalid configuration for plugin {name}")
+            # TODO: Apply configuration
         return plugin
@@ -10,13 +10,17 @@ class DependencyError(Exception):
     Attributes:
         plugin (str): Name of the plugin with the dependency issue.
         dependency (str): Name of the dependency causing the issue.
+        reason (str): What is wrong with the dependency (e.g. 'not found').
         message (str): Explanation of the error.
     """
 
-    def __init__(self, plugin: str, dependency: str):
+    def __init__(self, plugin: str, dependency: str, reason: str = ""):
         self.plugin = plugin
         self.dependency = dependency
-        self.message = f"DependencyError for plugin: '{self.plugin}' - Dependency: '{self.dependency}')"
+        self.reason = reason
+        self.message = f"DependencyError for plugin: '{self.plugin}' - Dependency: '{self.dependency}'"
+        if reason:
+            self.message += f" ({reason})"
         super().__init__(self.message)
 
     def __str__(self):
@@ -1,15 +1,18 @@
 """
 SystemInfo Class Module
 
-This module defines a SystemInfo class that gathers system information at initialization
+This module defines a SystemInfo class that gathers system information on first access
 and provides access to this data using the [] operator. It collects information about
 the CPU, memory, operating system, and infrastructure (environment type).
 
 Classes:
     SystemInfo: A class to collect and store system information.
 
+Functions:
+    get_system_info: Get the shared SystemInfo instance.
+
 Usage:
-    sys_info = SystemInfo()
+    sys_info = get_system_info()
     cpu_info = sys_info['cpu']
     mem_info = sys_info['mem']
     os_info = sys_info['os']
@@ -17,10 +20,10 @@ Usage:
 """
 
 # Python Imports
-import psutil
 import platform
+import functools
 import subprocess
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Local Imports
 from src.api.utils.bytes import bytes_to_human_readable
@@ -31,26 +34,57 @@ class SystemInfo:
     A class to collect and store system information.
 
     This class gathers information about the system's CPU, memory, operating system,
-    and infrastructure (environment type) upon initialization. The information can be
-    accessed using dictionary-like syntax with the [] operator.
+    and infrastructure (environment type). Each section is collected the first time it
+    is accessed and cached afterwards. The information can be accessed using
+    dictionary-like syntax with the [] operator.
 
     Attributes:
+        cpu (Dict[str, Any]): CPU information.
+        mem (Dict[str, Any]): Memory information.
+        os (Dict[str, Any]): Operating system information.
+        infra (Dict[str, Any]): Infrastructure information.
         info (Dict[str, Any]): A dictionary containing all gathered system information.
 
     Methods:
         __getitem__(key): Allows accessing information using dictionary-like syntax.
     """
 
-    def __init__(self):
+    SECTIONS = ('cpu', 'mem', 'os', 'infra')
+
+    @functools.cached_property
+    def cpu(self) -> Dict[str, Any]:
         """
-        Initialize the SystemInfo instance and gather all system information.
+        CPU information, collected on first access.
         """
-        self.info = {
-            'cpu': self._get_cpu_info(),
-            'mem': self._get_memory_info(),
-            'os': self._get_os_info(),
-            'infra': self._get_infrastructure_info(),
-        }
+        return self._get_cpu_info()
+
+    @functools.cached_property
+    def mem(self) -> Dict[str, Any]:
+        """
+        Memory information, collected on first access.
+        """
+        return self._get_memory_info()
+
+    @functools.cached_property
+    def os(self) -> Dict[str, Any]:
+        """
+        Operating system information, collected on first access.
+        """
+        return self._get_os_info()
+
+    @functools.cached_property
+    def infra(self) -> Dict[str, Any]:
+        """
+        Infrastructure information, collected on first access.
+        """
+        return self._get_infrastructure_info()
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        """
+        All system information, collecting any section that has not been accessed yet.
+        """
+        return {key: getattr(self, key) for key in self.SECTIONS}
 
     def __getitem__(self, key):
         """
@@ -62,7 +96,9 @@ class SystemInfo:
         Returns:
             Any: The requested information, or None if the key is not found.
         """
-        return self.info.get(key, None)
+        if key not in self.SECTIONS:
+            return None
+        return getattr(self, key)
 
     def _get_cpu_info(self) -> Dict[str, Any]:
         """
@@ -75,10 +111,12 @@ class SystemInfo:
                 - max_freq: Maximum CPU frequency (if available)
                 - model: CPU model information
         """
+        import psutil
+        freq = psutil.cpu_freq()
         return {
             "pcores": psutil.cpu_count(logical=False),
             "lcores": psutil.cpu_count(logical=True),
-            "max_freq": psutil.cpu_freq().max if hasattr(psutil.cpu_freq(), 'max') else None,
+            "max_freq": freq.max if hasattr(freq, 'max') else None,
             "model": platform.processor()
         }
 
@@ -91,6 +129,7 @@ class SystemInfo:
                 - total: Total physical memory in bytes
                 - human_readable: Total physical memory in a human-readable format
         """
+        import psutil
         mem = psutil.virtual_memory()
         return {
             "total": mem.total,
@@ -131,10 +170,14 @@ class SystemInfo:
             pass
         return os_info
 
-    def _get_linux_distro(self) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_linux_distro() -> str:
         """
         Get Linux distribution information.
 
+        The result is cached, since the distribution cannot change while the process runs.
+
         This method tries multiple approaches to determine the Linux distribution:
         1. Using the 'distro' library
         2. Reading from /etc/os-release file
@@ -219,3 +262,19 @@ class SystemInfo:
             Dict[str, str]: A dictionary containing cloud-specific details.
         """
         return {}
+
+
+_instance: Optional[SystemInfo] = None
+
+
+def get_system_info() -> SystemInfo:
+    """
+    Get the shared SystemInfo instance, creating it on first use.
+
+    Returns:
+        SystemInfo: The SystemInfo instance shared across the application.
+    """
+    global _instance
+    if _instance is None:
+        _instance = SystemInfo()
+    return _instance
@@ -4,26 +4,111 @@ DStone Module
 
 This module defines the DStone class, which is responsible for plugin management
 and providing the basic UI framework using Dash.
+
+Dash is imported where the UI is built, so plugin discovery, loading and execution
+work without importing it.
 """
 
+from __future__ import annotations
+
 # Python Imports
 import os
+import sys
+import functools
+import bisect
 import importlib
 import inspect
 import logging
-from pathlib import Path
-from typing import Dict, Any
+import pkgutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Set, Tuple
 
 # Library Imports
-import dash
-import dash_bootstrap_components as dbc
-from dash import html
+if TYPE_CHECKING:
+    import dash
 
 # Local Imports
 from src.core.base_plugin import BasePlugin
 from src.core.exceptions import DependencyError
-from src.core.system_info import SystemInfo
-from src.api.io.fs import list_directories
+from src.core.system_info import get_system_info
+
+
+# Sidebar navigation entries: (Font Awesome icon, label, href)
+_NAV_ITEMS = (
+    ("fas fa-home", "Dashboard", "/"),
+    ("fas fa-calendar-alt", "Projects", "/projects"),
+    ("fas fa-envelope-open-text", "Datasets", "/datasets"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _sidebar_body() -> tuple:
+    """
+    Build everything in the sidebar below the logo, which is the only part that depends
+    on the app. The components are built on first use and shared by all apps.
+
+    Returns:
+        tuple: The Dash components of the sidebar body.
+    """
+    import dash_bootstrap_components as dbc
+    from dash import html
+
+    nav_links = [
+        dbc.NavLink(
+            [html.I(className=f"{icon} me-2"), html.Span(label)],
+            href=href,
+            active="exact",
+        )
+        for icon, label, href in _NAV_ITEMS
+    ]
+    return (
+        html.Hr(),
+        dbc.Nav(
+            nav_links,
+            vertical=True,
+            pills=True,
+        ),
+    )
+
+
+def _cached_import(module_name: str) -> ModuleType:
+    """
+    Import a module, returning it straight from sys.modules if it was imported before.
+
+    Args:
+        module_name (str): The dotted name of the module.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        importlib.import_module(module_name)
+    return modules[module_name]
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_plugin_dir(plugin_dir: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Find the plugin packages in a directory.
+
+    The result is cached for the lifetime of the process, so constructing DStone again
+    does not probe the filesystem again; call _scan_plugin_dir.cache_clear() after
+    adding or removing plugins at runtime.
+
+    Args:
+        plugin_dir (str): The directory to search for plugins.
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: (directory name, module name) pairs of the
+        packages in the directory.
+    """
+    # The path entry finder that pkgutil reuses lists the directory once and knows packages
+    return tuple((module_info.name, f"src.plugins.{module_info.name}")
+                 for module_info in pkgutil.iter_modules([plugin_dir]) if module_info.ispkg)
 
 
 class DStone:
@@ -49,8 +134,8 @@ class DStone:
 
         The initialization process includes:
         1. Discovering plugins from the specified directory.
-        2. Setting up the Dash application with specific configurations.
-        3. Initializing the user interface.
+        2. Preparing the Dash application, which is created together with the user
+           interface on first access of the app property (at the latest in run()).
 
         Note:
             - The Dash application is configured to suppress callback exceptions,
@@ -61,47 +146,110 @@ class DStone:
         # Get logger for this module
         self.logger = logging.getLogger(__name__)
 
-        self.system_info = SystemInfo()
+        self.system_info = get_system_info()
         self.plugins: Dict[str, BasePlugin] = {}
+        self._plugins_by_priority: List[BasePlugin] = []
+        self._execution_order: Optional[List[BasePlugin]] = None
+        self._epoch = 0
+        self._rejected: Set[str] = set()
         self.discover_plugins(plugins_dir)
 
-        self.app = dash.Dash(
-            __name__,
-            suppress_callback_exceptions=True,
-            external_stylesheets=[dbc.themes.CYBORG, dbc.icons.FONT_AWESOME],
-            add_log_handler=False,
-            assets_folder=assets_dir,
-        )
+        self._assets_dir = assets_dir
+        self._app: Optional[dash.Dash] = None
 
-        self.setup_ui()
+    @property
+    def app(self) -> dash.Dash:
+        """
+        The Dash application, created with its user interface on first access.
 
-    def discover_plugins(self, plugin_dir: str) -> None:
+        Introspecting plugins does not need the web application, so it is only built once
+        something actually uses it.
+        """
+        if self._app is None:
+            import dash
+            import dash_bootstrap_components as dbc
+
+            self._app = dash.Dash(
+                __name__,
+                suppress_callback_exceptions=True,
+                external_stylesheets=[dbc.themes.CYBORG, dbc.icons.FONT_AWESOME],
+                add_log_handler=False,
+                assets_folder=self._assets_dir,
+            )
+            self.setup_ui()
+        return self._app
+
+    def discover_plugins(self, plugin_dir: str, parallel: bool = True) -> None:
         """
         Discover plugins in the specified directory.
 
         Args:
             plugin_dir (str): The directory to search for plugins.
+            parallel (bool): Whether to import the plugin packages on a thread pool.
+                             Registration always happens afterwards, in directory order.
         """
 
-        self.logger.info(f"Discovering plugins in: '{plugin_dir}'")
+        self.logger.info("Discovering plugins in: '%s'", plugin_dir)
+
+        # TODO: Unify naming of Module, Filename and Plugin itself.
+        module_names = {}
+        for dirname, module_name in _scan_plugin_dir(plugin_dir):
+            # Packages without a plugin class were already reported by an earlier discovery
+            if module_name in self._rejected:
+                continue
+            self.logger.info("Checking plugin: '%s' in: '%s'", dirname, os.path.join(plugin_dir, dirname))
+            module_names[dirname] = module_name
+
+        if parallel and len(module_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                modules = list(executor.map(_cached_import, module_names.values()))
+        else:
+            modules = [_cached_import(module_name) for module_name in module_names.values()]
+
+        for (dirname, module_name), module in zip(module_names.items(), modules):
+            plugin_class = self._find_plugin_class(dirname, module_name, module)
+            if plugin_class is None:
+                self._rejected.add(module_name)
+                continue
+            self.register_plugin(module_name, plugin_class)
+            self.logger.info("Plugin: '%s' registered.", dirname)
+
+    def _find_plugin_class(self, dirname: str, module_name: str, module: ModuleType) -> Optional[type]:
+        """
+        Find the plugin class of an imported plugin package.
 
-        for dirname in list_directories(plugin_dir):
+        The 'plugin_class' attribute of the package decides. Packages that do not define it
+        fall back to the BasePlugin subclasses registered while importing the package, as
+        long as there is exactly one concrete subclass.
 
-            dirpath = Path(plugin_dir) / dirname
-            initfile = dirpath / '__init__.py'
-            self.logger.info(f"Checking plugin: '{dirname}' in: '{str(dirpath)}'")
+        Args:
+            dirname (str): The directory name of the plugin package.
+            module_name (str): The module name of the plugin package.
+            module (ModuleType): The imported plugin package.
 
-            if os.path.exists(initfile):
-                # TODO: Unify naming of Module, Filename and Plugin itself.
-                module_name = f"src.plugins.{dirname}"
-                module = importlib.import_module(module_name)
-                if hasattr(module, 'plugin_class'):
-                    plugin_class = getattr(module, 'plugin_class')
-                    if issubclass(plugin_class, BasePlugin):
-                        self.register_plugin(module_name, plugin_class)
-                        self.logger.info(f"Plugin: '{dirname}' registered.")
-                else:
-                    self.logger.warning(f"Plugin '{dirname}' does not define 'plugin_class' in __init__.py")
+        Returns:
+            Optional[type]: The plugin class, or None if the package has no usable one.
+        """
+        plugin_class = getattr(module, 'plugin_class', None)
+        if plugin_class is not None:
+            if isinstance(plugin_class, type) and issubclass(plugin_class, BasePlugin):
+                return plugin_class
+            self.logger.warning("Plugin '%s' defines a 'plugin_class' that is not a BasePlugin subclass", dirname)
+            return None
+
+        # Importing the package registered its BasePlugin subclasses, pick up the concrete ones
+        package_prefix = module_name + '.'
+        plugin_classes = [plugin_class for qualified_name, plugin_class in BasePlugin._subclasses.items()
+                          if qualified_name.startswith(package_prefix) and not inspect.isabstract(plugin_class)]
+        if not plugin_classes:
+            self.logger.warning("Plugin '%s' does not define 'plugin_class' in __init__.py", dirname)
+            return None
+        if len(plugin_classes) > 1:
+            self.logger.warning("Plugin '%s' defines several BasePlugin subclasses (%s), set 'plugin_class' "
+                                "in __init__.py to choose one",
+                                dirname, ", ".join(plugin_class.__qualname__ for plugin_class in plugin_classes))
+            return None
+        return plugin_classes[0]
 
     def register_plugin(self, plugin_name: str, plugin_class: type) -> None:
         """
@@ -110,18 +258,32 @@ class DStone:
         Args:
             plugin_class (type): The class of the plugin to register.
         """
+        meta = plugin_class._meta
         plugin_instance = plugin_class.create(
             name=plugin_name,
-            version=getattr(plugin_class, 'version', '0.1'),
-            description=getattr(plugin_class, 'description', 'No description provided'),
+            version=meta.version,
+            description=meta.description,
             app=self
         )
+
+        previous = self.plugins.get(plugin_instance.name)
+        if previous is not None:
+            self._plugins_by_priority.remove(previous)
         self.plugins[plugin_instance.name] = plugin_instance
 
+        # Kept sorted by priority as plugins arrive, ties stay in registration order
+        bisect.insort(self._plugins_by_priority, plugin_instance, key=attrgetter('priority'))
+        self._execution_order = None
+        self._epoch += 1
+
     def load_plugin(self, plugin_name: str) -> None:
         """
         Load a registered plugin and check its dependencies.
 
+        Dependencies that are not initialized yet are loaded first. A plugin's initialized
+        flag marks its whole dependency subtree as loaded, so loaded subtrees are never
+        walked again.
+
         Args:
             plugin_name (str): The name of the plugin to load.
 
@@ -131,17 +293,68 @@ class DStone:
         """
         if plugin_name not in self.plugins:
             raise ValueError(f"Plugin {plugin_name} not found")
+        if self.plugins[plugin_name].initialized:
+            return
+
+        for name in self._load_order(plugin_name):
+            self.plugins[name].initialized = True
 
-        plugin = self.plugins[plugin_name]
+    def _load_order(self, root: str) -> List[str]:
+        """
+        Order a plugin and its uninitialized dependencies so that dependencies come first.
+
+        Walks the part of the dependency graph reachable from the plugin once, then sorts
+        it with Kahn's algorithm.
 
-        # Check dependencies
-        for dependency in plugin.dependencies:
-            if dependency not in self.plugins:
-                raise DependencyError(f"Dependency {dependency} for plugin {plugin_name} not found")
-            if not self.plugins[dependency].initialized:
-                self.load_plugin(dependency)  # Recursively load dependencies
+        Args:
+            root (str): The name of the plugin to load.
 
-        plugin.initialized = True
+        Returns:
+            List[str]: The names of the plugins to initialize, in order.
+
+        Raises:
+            DependencyError: If a dependency is not registered or part of a cycle.
+        """
+        plugins = self.plugins
+
+        # Collect the plugins that still need loading
+        pending = {root}
+        stack = [root]
+        while stack:
+            plugin_name = stack.pop()
+            for dependency in plugins[plugin_name].dependencies:
+                dependency_plugin = plugins.get(dependency)
+                if dependency_plugin is None:
+                    raise DependencyError(plugin_name, dependency, "not found")
+                if dependency not in pending and not dependency_plugin.initialized:
+                    pending.add(dependency)
+                    stack.append(dependency)
+
+        in_degree = dict.fromkeys(pending, 0)
+        dependents = {plugin_name: [] for plugin_name in pending}
+        for plugin_name in pending:
+            for dependency in plugins[plugin_name].dependencies:
+                if dependency in pending:
+                    in_degree[plugin_name] += 1
+                    dependents[dependency].append(plugin_name)
+
+        ready = deque(plugin_name for plugin_name, count in in_degree.items() if not count)
+        order = []
+        while ready:
+            plugin_name = ready.popleft()
+            order.append(plugin_name)
+            for dependent in dependents[plugin_name]:
+                in_degree[dependent] -= 1
+                if not in_degree[dependent]:
+                    ready.append(dependent)
+
+        if len(order) != len(pending):
+            # The plugins left over are waiting on each other
+            plugin_name = next(name for name, count in in_degree.items() if count)
+            dependency = next(name for name in plugins[plugin_name].dependencies if in_degree.get(name))
+            raise DependencyError(plugin_name, dependency, "dependency cycle")
+
+        return order
 
     def load_all_plugins(self) -> None:
         """
@@ -151,36 +364,79 @@ class DStone:
             if not self.plugins[plugin_name].initialized:
                 self.load_plugin(plugin_name)
 
-    def execute_plugins(self) -> None:
+        self._execution_order = self._compute_execution_order()
+
+    def _compute_execution_order(self) -> List[BasePlugin]:
         """
-        Execute all loaded plugins, respecting dependencies and priorities.
+        Order the registered plugins so that every plugin comes after its dependencies.
+
+        Plugins are taken by priority (lower number first, then the earliest registered),
+        each one preceded by its dependencies that have not been ordered yet, in the order
+        they are declared.
+
+        Returns:
+            List[BasePlugin]: The plugins in execution order.
+
+        Raises:
+            DependencyError: If a dependency is not registered or part of a cycle.
         """
-        # Sort plugins by priority (lower number = higher priority)
-        sorted_plugins = sorted(self.plugins.values(), key=lambda x: x.priority)
+        plugins = self.plugins
+        order = []
+        done = set()
+        visiting = set()
+
+        for root in self._plugins_by_priority:
+            if root.name in done:
+                continue
+
+            # Depth-first walk without recursion, a plugin is ordered once its dependencies are
+            visiting.add(root.name)
+            stack = [(root, iter(root.dependencies))]
+            while stack:
+                plugin, dependencies = stack[-1]
+                for dependency in dependencies:
+                    if dependency in done:
+                        continue
+                    if dependency in visiting:
+                        raise DependencyError(plugin.name, dependency, "dependency cycle")
+                    dependency_plugin = plugins.get(dependency)
+                    if dependency_plugin is None:
+                        raise DependencyError(plugin.name, dependency, "not found")
+                    visiting.add(dependency)
+                    stack.append((dependency_plugin, iter(dependency_plugin.dependencies)))
+                    break
+                else:
+                    stack.pop()
+                    visiting.discard(plugin.name)
+                    done.add(plugin.name)
+                    order.append(plugin)
 
-        executed = set()
+        return order
 
-        def execute_with_dependencies(plugin):
-            if plugin.name in executed:
-                return
+    def execute_plugins(self) -> None:
+        """
+        Execute all loaded plugins, respecting dependencies and priorities.
 
-            # Execute dependencies first
-            for dep_name in plugin.dependencies:
-                dep_plugin = self.plugins[dep_name]
-                execute_with_dependencies(dep_plugin)
+        The execution order is computed once and reused until a plugin is registered.
+        Idempotent plugins are skipped if they already ran since the last registration.
+        """
+        if self._execution_order is None:
+            self._execution_order = self._compute_execution_order()
 
-            # Execute the plugin
+        epoch = self._epoch
+        for plugin in self._execution_order:
+            if plugin.idempotent and plugin._last_epoch == epoch:
+                continue
             plugin.execute()
-            executed.add(plugin.name)
-
-        # Execute plugins in order of priority
-        for plugin in sorted_plugins:
-            execute_with_dependencies(plugin)
+            plugin._last_epoch = epoch
 
     def setup_ui(self) -> None:
         """
         Set up the basic UI structure using Dash.
         """
+        import dash
+        from dash import html
+
         # TODO: Implement the base UI setup here
 
         sidebar = html.Div(
@@ -191,34 +447,7 @@ class DStone:
                     ],
                     className="sidebar-header",
                 ),
-                html.Hr(),
-                dbc.Nav(
-                    [
-                        dbc.NavLink(
-                            [html.I(className="fas fa-home me-2"), html.Span("Dashboard")],
-                            href="/",
-                            active="exact",
-                        ),
-                        dbc.NavLink(
-                            [
-                                html.I(className="fas fa-calendar-alt me-2"),
-                                html.Span("Projects"),
-                            ],
-                            href="/projects",
-                            active="exact",
-                        ),
-                        dbc.NavLink(
-                            [
-                                html.I(className="fas fa-envelope-open-text me-2"),
-                                html.Span("Datasets"),
-                            ],
-                            href="/datasets",
-                            active="exact",
-                        ),
-                    ],
-                    vertical=True,
-                    pills=True,
-                ),
+                *_sidebar_body(),
             ],
             className="sidebar",
         )
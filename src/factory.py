@@ -6,6 +6,8 @@ required by the DStone application. It centralizes the instantiation logic, maki
 it easier to manage dependencies and configurations across the application.
 """
 
+from __future__ import annotations
+
 # Python Imports
 import logging
 from typing import Dict, Any
@@ -44,8 +46,10 @@ def create_dstone_instance(configs: Dict[str, Any], dstone_root: Path) -> DStone
     dstone = DStone(str(plugins_dir),
                     str(assets_dir))
 
-    # Log discovered plugins
-    for plugin_name, plugin in dstone.plugins.items():
-        logger.info(f"Discovered plugin: {plugin_name} (v{plugin.version}): {plugin.description}")
+    # Log discovered plugins, as a single record rather than one per plugin
+    if dstone.plugins:
+        logger.info("Discovered plugins:\n%s",
+                    "\n".join(f"- {plugin_name} (v{plugin.version}): {plugin.description}"
+                              for plugin_name, plugin in dstone.plugins.items()))
 
     return dstone
@@ -9,6 +9,8 @@ Classes:
     DummyPlugin: A template plugin class implementing the BasePlugin interface.
 """
 
+from __future__ import annotations
+
 from src.core.base_plugin import BasePlugin
 from typing import Dict, Any, List
 
@@ -59,7 +61,7 @@ class DummyPlugin(BasePlugin):
         Returns:
             Any: The result of the plugin execution.
         """
-        self.logger.info(f"Executing {self.name}")
+        self.logger.info("Executing %s", self.name)
         # TODO: Add your plugin's main functionality here
         return "Dummy execution result"
 
@@ -69,7 +71,7 @@ class DummyPlugin(BasePlugin):
 
         This method should be implemented to create any UI components for the plugin.
         """
-        self.logger.info(f"Setting up UI for {self.name}")
+        self.logger.info("Setting up UI for %s", self.name)
         # TODO: Add your UI setup code here
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
@@ -82,7 +84,7 @@ class DummyPlugin(BasePlugin):
         Returns:
             bool: True if the configuration is valid, False otherwise.
         """
-        self.logger.info(f"Validating config for {self.name}")
+        self.logger.info("Validating config for %s", self.name)
         # TODO: Add your configuration validation logic here
         return True
 
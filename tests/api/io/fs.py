@@ -0,0 +1,194 @@
+import sys
+sys.pycache_prefix = "/tmp/dstone/"
+
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.api.io.fs import copy_file, read_text_file, copy_directory_fast, recursive_search, \
+    recursive_search_parallel, filter_by_extension, filter_by_name_pattern, filter_by_size
+
+
+def make_tree(root, files):
+    """
+    Create the given files, a mapping of relative paths to contents, below root.
+    """
+    for relative_path, content in files.items():
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(content)
+
+
+def read_tree(root):
+    """
+    Map the relative path of every file below root to its contents, without following links.
+    """
+    tree = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if not os.path.islink(path):
+                with open(path) as file:
+                    tree[os.path.relpath(path, root)] = file.read()
+    return tree
+
+
+def unreadable(*paths):
+    """
+    Make os.scandir fail with PermissionError for the given directories, which works even
+    when the tests run as root.
+    """
+    scandir = os.scandir
+    denied = {os.path.normpath(path) for path in paths}
+
+    def guarded_scandir(path='.'):
+        if os.path.normpath(os.fspath(path)) in denied:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    return mock.patch('os.scandir', guarded_scandir)
+
+
+def search_paths(search, *args, **kwargs):
+    """
+    Run a search and return the set of paths it yielded.
+    """
+    return {entry.path for entry in search(*args, **kwargs)}
+
+
+class TestFsModule(unittest.TestCase):
+
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        self.src = os.path.join(self.root, 'src')
+        make_tree(self.src, {
+            'a.txt': 'a',
+            'b.py': 'b',
+            os.path.join('sub', 'c.TXT'): 'c',
+            os.path.join('sub', 'deeper', 'd.txt'): 'd',
+            os.path.join('other', 'e.log'): 'e',
+        })
+
+    def test_copy_file_metadata(self):
+        src = os.path.join(self.src, 'a.txt')
+        os.chmod(src, 0o604)
+        os.utime(src, (1000000000, 1000000000))
+
+        for preserve_metadata in (False, True):
+            with self.subTest(preserve_metadata=preserve_metadata):
+                dst = os.path.join(self.root, f'copy_{preserve_metadata}.txt')
+                copy_file(src, dst, preserve_metadata=preserve_metadata)
+                with open(dst) as file:
+                    self.assertEqual(file.read(), 'a')
+                copied = os.stat(dst)
+                self.assertEqual(stat.S_IMODE(copied.st_mode) == 0o604, preserve_metadata)
+                self.assertEqual(copied.st_mtime == 1000000000, preserve_metadata)
+
+        # Copying into a directory keeps the file name
+        copy_file(src, self.root)
+        self.assertTrue(os.path.isfile(os.path.join(self.root, 'a.txt')))
+
+    def test_read_text_file_newlines(self):
+        path = os.path.join(self.root, 'newlines.txt')
+        for raw, expected in ((b'a\r\nb\r\n', 'a\nb\n'), (b'a\rb\r', 'a\nb\n'), (b'a\r\r\nb\n\r', 'a\n\nb\n\n'),
+                              (b'no newline', 'no newline'), ('\u00e9\r\n'.encode('utf-8'), '\u00e9\n')):
+            with self.subTest(raw=raw):
+                with open(path, 'wb') as file:
+                    file.write(raw)
+                self.assertEqual(read_text_file(path), expected)
+                # Universal newlines mode gives the same result
+                with open(path, encoding='utf-8') as file:
+                    self.assertEqual(file.read(), expected)
+
+    def test_copy_directory_fast(self):
+        dst = os.path.join(self.root, 'dst')
+        copy_directory_fast(self.src, dst, workers=2)
+        self.assertEqual(read_tree(dst), read_tree(self.src))
+
+        with self.assertRaises(FileExistsError):
+            copy_directory_fast(self.src, dst)
+        with self.assertRaises(FileNotFoundError):
+            copy_directory_fast(os.path.join(self.root, 'missing'), os.path.join(self.root, 'dst2'))
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "Symbolic links are not supported")
+    def test_copy_directory_fast_symlinks(self):
+        os.symlink('a.txt', os.path.join(self.src, 'link.txt'))
+        os.symlink('sub', os.path.join(self.src, 'linked_sub'))
+        # A link back to an ancestor must not be followed
+        os.symlink('..', os.path.join(self.src, 'sub', 'loop'))
+
+        dst = os.path.join(self.root, 'dst')
+        copy_directory_fast(self.src, dst)
+        self.assertEqual(read_tree(dst), read_tree(self.src))
+        for link in ('link.txt', 'linked_sub', os.path.join('sub', 'loop')):
+            with self.subTest(link=link):
+                self.assertTrue(os.path.islink(os.path.join(dst, link)))
+                self.assertEqual(os.readlink(os.path.join(dst, link)), os.readlink(os.path.join(self.src, link)))
+
+    def test_recursive_search_modes(self):
+        entries = list(recursive_search(self.src))
+        self.assertTrue(all(isinstance(entry, os.DirEntry) and entry.is_file() for entry in entries))
+
+        paths = list(recursive_search(self.src, as_path=True))
+        self.assertTrue(all(isinstance(path, Path) for path in paths))
+        self.assertEqual({str(path) for path in paths}, {entry.path for entry in entries})
+        self.assertEqual(len(paths), 5)
+
+        with self.assertRaises(FileNotFoundError):
+            list(recursive_search(os.path.join(self.root, 'missing')))
+
+    def test_recursive_search_filters(self):
+        # The extension filter is matched inline and ignores case, like calling it on each entry
+        txt_filter = filter_by_extension('txt')
+        self.assertEqual(search_paths(recursive_search, self.src, txt_filter),
+                         {entry.path for entry in recursive_search(self.src) if txt_filter(entry)})
+        self.assertEqual({path.name for path in recursive_search(self.src, txt_filter, as_path=True)},
+                         {'a.txt', 'c.TXT', 'd.txt'})
+        self.assertIs(filter_by_extension('txt'), txt_filter)
+
+        # Other filters are called with the os.DirEntry of every file, even if they have a 'suffix'
+        seen = []
+
+        def custom_filter(entry):
+            seen.append(entry)
+            return entry.name == 'b.py'
+        custom_filter.suffix = '.txt'
+        self.assertEqual([entry.name for entry in recursive_search(self.src, custom_filter)], ['b.py'])
+        self.assertEqual(len(seen), 5)
+        self.assertTrue(all(isinstance(entry, os.DirEntry) for entry in seen))
+
+        self.assertEqual({path.name for path in recursive_search(self.src, filter_by_name_pattern('*.py'), True)},
+                         {'b.py'})
+        self.assertEqual(len(list(recursive_search(self.src, filter_by_size(min_size=2)))), 0)
+        self.assertTrue(filter_by_size(max_size=1)(Path(self.src, 'a.txt')))
+
+    def test_recursive_search_parallel(self):
+        expected = {os.path.join(self.src, path) for path in
+                    ('a.txt', 'b.py', os.path.join('sub', 'c.TXT'), os.path.join('sub', 'deeper', 'd.txt'),
+                     os.path.join('other', 'e.log'))}
+        self.assertEqual(search_paths(recursive_search, self.src), expected)
+        self.assertEqual(search_paths(recursive_search_parallel, self.src, max_workers=2), expected)
+
+        txt_filter = filter_by_extension('txt')
+        self.assertEqual(search_paths(recursive_search_parallel, self.src, txt_filter),
+                         search_paths(recursive_search, self.src, txt_filter))
+        self.assertEqual(len(search_paths(recursive_search_parallel, self.src, txt_filter)), 3)
+
+        with self.assertRaises(FileNotFoundError):
+            list(recursive_search_parallel(os.path.join(self.root, 'missing')))
+
+    def test_recursive_search_parallel_unreadable_subdirectory(self):
+        with unreadable(os.path.join(self.src, 'other'), os.path.join(self.src, 'sub', 'deeper')):
+            expected = {os.path.join(self.src, path) for path in ('a.txt', 'b.py', os.path.join('sub', 'c.TXT'))}
+            self.assertEqual(search_paths(recursive_search, self.src), expected)
+            self.assertEqual(search_paths(recursive_search_parallel, self.src), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
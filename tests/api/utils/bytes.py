@@ -2,95 +2,201 @@ import sys
 sys.pycache_prefix = "/tmp/dstone/"
 
 import unittest
+import importlib.util
 
-from src.api.utils.bytes import bytes_to_human_readable, \
+from src.api.utils.bytes import bytes_to_human_readable, bytes_to_human_readable_array, \
     human_readable_to_bytes, bits_to_human_readable, bits_to_bytes, \
     bytes_to_bits, binary_prefix_to_decimal_prefix, decimal_prefix_to_binary_prefix, \
     bits_per_second_to_human_readable, bytes_per_second_to_human_readable, \
-    seconds_to_human_readable, little_endian_to_big_endian, big_endian_to_little_endian, \
+    seconds_to_human_readable, little_endian_to_big_endian, big_endian_to_little_endian, swap_word_endianness, \
     int_to_bytes, bytes_to_int, hex_to_bytes, bytes_to_hex, bytes_to_base64, base64_to_bytes
 
 
+# (bytes, expected) pairs shared by the scalar and the array conversion tests
+HUMAN_READABLE_CASES = (
+    (0, "0.00 B"),
+    (1023, "1023.00 B"),
+    (1024, "1.00 KiB"),
+    (1048576, "1.00 MiB"),
+    (1.5 * 1024**3, "1.50 GiB"),
+    (2**70, "1024.00 EiB"),
+)
+
+# (little-endian, big-endian) pairs shared by both endianness conversions
+ENDIAN_CASES = (
+    (b'\x01\x00\x00\x00', b'\x00\x00\x00\x01'),
+    (b'\x01\x02', b'\x02\x01'),
+)
+
+# (integer, int_to_bytes arguments, bytes) triples shared by int_to_bytes and bytes_to_int
+INT_BYTES_CASES = (
+    (258, {}, b'\x01\x02'),
+    (258, {'length': 4, 'byteorder': 'little'}, b'\x02\x01\x00\x00'),
+    (0, {}, b'\x00'),
+)
+
+# (bytes, encoded) pairs shared by the encoding and the decoding tests
+HEX_CASES = (
+    (b'Hello', '48656c6c6f'),
+    (b'\x00\xff', '00ff'),
+)
+BASE64_CASES = (
+    (b'Hello', 'SGVsbG8='),
+    (b'\x00\xff', 'AP8='),
+)
+
+
 class TestBytesModule(unittest.TestCase):
 
     def test_bytes_to_human_readable(self):
-        self.assertEqual(bytes_to_human_readable(1023), "1023.00 B")
-        self.assertEqual(bytes_to_human_readable(1024), "1.00 KiB")
-        self.assertEqual(bytes_to_human_readable(1048576), "1.00 MiB")
+        for value, expected in HUMAN_READABLE_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(bytes_to_human_readable(value), expected)
+
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), "NumPy is not installed")
+    def test_bytes_to_human_readable_array(self):
+        import numpy as np
+
+        values, expected = zip(*HUMAN_READABLE_CASES)
+        strings = bytes_to_human_readable_array(values)
+        self.assertIsInstance(strings, np.ndarray)
+        self.assertEqual(strings.tolist(), list(expected))
+
+        # A larger batch spanning every unit must match the scalar conversion
+        values = [2 ** (index % 80) + index for index in range(10000)]
+        self.assertEqual(bytes_to_human_readable_array(values).tolist(),
+                         [bytes_to_human_readable(value) for value in values])
+
+        # Scalars, iterators and nested values are accepted as well
+        self.assertEqual(bytes_to_human_readable_array(1024).tolist(), ["1.00 KiB"])
+        self.assertEqual(bytes_to_human_readable_array(iter([1, 2048])).tolist(), ["1.00 B", "2.00 KiB"])
+        self.assertEqual(bytes_to_human_readable_array([[1], [2048]]).tolist(), ["1.00 B", "2.00 KiB"])
+        self.assertEqual(bytes_to_human_readable_array([]).shape, (0,))
 
     def test_human_readable_to_bytes(self):
-        self.assertEqual(human_readable_to_bytes('1 B'), 1)
-        self.assertEqual(human_readable_to_bytes('1 KiB'), 1024)
-        self.assertEqual(human_readable_to_bytes('1 MiB'), 1048576)
-        with self.assertRaises(ValueError):
-            human_readable_to_bytes('invalid input')
+        for text, expected in (('1 B', 1), ('1 KiB', 1024), ('1 MiB', 1048576), (' 1.5kib ', 1536),
+                               ('3Gi', 3221225472)):
+            with self.subTest(text=text):
+                self.assertEqual(human_readable_to_bytes(text), expected)
+        for text in ('invalid input', '1.2.3 MiB', '.5 MiB', '1 KB'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    human_readable_to_bytes(text)
 
     def test_bits_to_human_readable(self):
-        self.assertEqual(bits_to_human_readable(1000), "1.00 Kbit")
-        self.assertEqual(bits_to_human_readable(1000000), "1.00 Mbit")
-        self.assertEqual(bits_to_human_readable(1000000000), "1.00 Gbit")
+        for value, expected in ((1000, "1.00 Kbit"), (1000000, "1.00 Mbit"), (1000000000, "1.00 Gbit")):
+            with self.subTest(value=value):
+                self.assertEqual(bits_to_human_readable(value), expected)
 
     def test_bits_to_bytes(self):
-        self.assertEqual(bits_to_bytes(8), 1.0)
-        self.assertEqual(bits_to_bytes(1024), 128.0)
+        for value, expected in ((8, 1.0), (1024, 128.0)):
+            with self.subTest(value=value):
+                self.assertEqual(bits_to_bytes(value), expected)
 
     def test_bytes_to_bits(self):
-        self.assertEqual(bytes_to_bits(1), 8.0)
-        self.assertEqual(bytes_to_bits(128), 1024.0)
+        for value, expected in ((1, 8.0), (128, 1024.0)):
+            with self.subTest(value=value):
+                self.assertEqual(bytes_to_bits(value), expected)
 
     def test_binary_prefix_to_decimal_prefix(self):
-        self.assertAlmostEqual(binary_prefix_to_decimal_prefix(1, 'MiB', 'MB'), 1.048576)
-        self.assertAlmostEqual(binary_prefix_to_decimal_prefix(1, 'GiB', 'GB'), 1.073741824)
+        for from_unit, to_unit, expected in (('MiB', 'MB', 1.048576), ('GiB', 'GB', 1.073741824)):
+            with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                self.assertAlmostEqual(binary_prefix_to_decimal_prefix(1, from_unit, to_unit), expected)
         with self.assertRaises(ValueError):
             binary_prefix_to_decimal_prefix(1, 'invalid', 'MB')
 
     def test_decimal_prefix_to_binary_prefix(self):
-        self.assertAlmostEqual(decimal_prefix_to_binary_prefix(1, 'MB', 'MiB'), 0.95367431640625)
-        self.assertAlmostEqual(decimal_prefix_to_binary_prefix(1, 'GB', 'GiB'), 0.9313225746154785)
+        for from_unit, to_unit, expected in (('MB', 'MiB', 0.95367431640625), ('GB', 'GiB', 0.9313225746154785)):
+            with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                self.assertAlmostEqual(decimal_prefix_to_binary_prefix(1, from_unit, to_unit), expected)
         with self.assertRaises(ValueError):
             decimal_prefix_to_binary_prefix(1, 'invalid', 'MiB')
 
     def test_bits_per_second_to_human_readable(self):
-        self.assertEqual(bits_per_second_to_human_readable(1000), "1.00 Kbit/s")
-        self.assertEqual(bits_per_second_to_human_readable(1500000), "1.50 Mbit/s")
+        for value, expected in ((1000, "1.00 Kbit/s"), (1500000, "1.50 Mbit/s")):
+            with self.subTest(value=value):
+                self.assertEqual(bits_per_second_to_human_readable(value), expected)
 
     def test_bytes_per_second_to_human_readable(self):
-        self.assertEqual(bytes_per_second_to_human_readable(1024), "1.00 KiB/s")
-        self.assertEqual(bytes_per_second_to_human_readable(1572864), "1.50 MiB/s")
+        for value, expected in ((1024, "1.00 KiB/s"), (1572864, "1.50 MiB/s")):
+            with self.subTest(value=value):
+                self.assertEqual(bytes_per_second_to_human_readable(value), expected)
 
     def test_seconds_to_human_readable(self):
-        self.assertEqual(seconds_to_human_readable(3661), "1 hour, 1 minute, 1 second")
-        self.assertEqual(seconds_to_human_readable(86400), "1 day")
+        for value, expected in ((3661, "1 hour, 1 minute, 1 second"), (86400, "1 day"),
+                                (90061.5, "1 day, 1 hour, 1 minute, 1 second"),
+                                (172922, "2 days, 2 minutes, 2 seconds")):
+            with self.subTest(value=value):
+                self.assertEqual(seconds_to_human_readable(value), expected)
 
     def test_little_endian_to_big_endian(self):
-        self.assertEqual(little_endian_to_big_endian(b'\x01\x00\x00\x00'), b'\x00\x00\x00\x01')
+        for little, big in ENDIAN_CASES:
+            with self.subTest(value=little):
+                self.assertEqual(little_endian_to_big_endian(little), big)
 
     def test_big_endian_to_little_endian(self):
-        self.assertEqual(big_endian_to_little_endian(b'\x00\x00\x00\x01'), b'\x01\x00\x00\x00')
+        for little, big in ENDIAN_CASES:
+            with self.subTest(value=big):
+                self.assertEqual(big_endian_to_little_endian(big), little)
+
+    def test_swap_word_endianness(self):
+        for value, width, expected in ((b'\x01\x00\x02\x00', 2, b'\x00\x01\x00\x02'),
+                                       (b'\x01\x00\x00\x00' * 3, 4, b'\x00\x00\x00\x01' * 3),
+                                       (bytes(range(8)), 8, bytes(range(8))[::-1])):
+            with self.subTest(value=value, width=width):
+                self.assertEqual(swap_word_endianness(value, width), expected)
+
+        # 1 MiB through every supported width, against a per-word reference
+        payload = bytes(range(256)) * 4096
+        self.assertEqual(big_endian_to_little_endian(little_endian_to_big_endian(payload)), payload)
+        for width in (2, 4, 8):
+            with self.subTest(width=width):
+                expected = b''.join(payload[i:i + width][::-1] for i in range(0, len(payload), width))
+                self.assertEqual(swap_word_endianness(payload, width), expected)
+        for width in (2, 3):
+            with self.subTest(width=width):
+                with self.assertRaises(ValueError):
+                    swap_word_endianness(b'\x01\x00\x02', width)
 
     def test_int_to_bytes(self):
-        self.assertEqual(int_to_bytes(258), b'\x01\x02')
-        self.assertEqual(int_to_bytes(258, length=4, byteorder='little'), b'\x02\x01\x00\x00')
+        for value, kwargs, expected in INT_BYTES_CASES:
+            with self.subTest(value=value, **kwargs):
+                self.assertEqual(int_to_bytes(value, **kwargs), expected)
 
     def test_bytes_to_int(self):
-        self.assertEqual(bytes_to_int(b'\x01\x02'), 258)
-        self.assertEqual(bytes_to_int(b'\x02\x01\x00\x00', byteorder='little'), 258)
+        for expected, kwargs, value in INT_BYTES_CASES:
+            byteorder = kwargs.get('byteorder', 'big')
+            with self.subTest(value=value, byteorder=byteorder):
+                self.assertEqual(bytes_to_int(value, byteorder=byteorder), expected)
 
     def test_hex_to_bytes(self):
-        self.assertEqual(hex_to_bytes('48656c6c6f'), b'Hello')
+        for expected, value in HEX_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(hex_to_bytes(value), expected)
         with self.assertRaises(ValueError):
             hex_to_bytes('invalid hex')
 
     def test_bytes_to_hex(self):
-        self.assertEqual(bytes_to_hex(b'Hello'), '48656c6c6f')
+        for value, expected in HEX_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(bytes_to_hex(value), expected)
 
     def test_base64_to_bytes(self):
-        self.assertEqual(base64_to_bytes('SGVsbG8='), b'Hello')
+        for expected, value in BASE64_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(base64_to_bytes(value), expected)
         with self.assertRaises(ValueError):
             base64_to_bytes('invalid base64!')
 
     def test_bytes_to_base64(self):
-        self.assertEqual(bytes_to_base64(b'Hello'), 'SGVsbG8=')
+        for value, expected in BASE64_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(bytes_to_base64(value), expected)
+
+    def test_large_payload_round_trip(self):
+        payload = bytes(range(256)) * 4096
+        self.assertEqual(hex_to_bytes(bytes_to_hex(payload)), payload)
+        self.assertEqual(base64_to_bytes(bytes_to_base64(payload)), payload)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,66 @@
+import sys
+sys.pycache_prefix = "/tmp/dstone/"
+
+import unittest
+import importlib.util
+
+from src.api.utils import bytes as bytes_utils
+
+if importlib.util.find_spec('numba'):
+    import numpy as np
+    from src.api.utils import bytes_numba
+
+
+PREFIX_UNITS = (('KiB', 'KB'), ('MiB', 'MB'), ('GiB', 'GB'), ('TiB', 'TB'), ('PiB', 'PB'))
+
+
+@unittest.skipUnless(importlib.util.find_spec('numba'), "Numba is not installed")
+class TestBytesNumbaModule(unittest.TestCase):
+
+    def setUp(self):
+        # Values spanning every unit, including the edge cases of the scalar conversion
+        values = [0.0, 1.0, 1023.0, 1024.0, 1.5 * 1024**3, 2.0**70, -5.0, float('inf')]
+        values += [2.0 ** (index % 80) + index for index in range(1000)]
+        self.values = np.array(values, dtype=np.float64)
+
+    def test_bits_and_bytes(self):
+        for value in self.values:
+            with self.subTest(value=value):
+                self.assertEqual(bytes_numba.bits_to_bytes(value), bytes_utils.bits_to_bytes(value))
+                self.assertEqual(bytes_numba.bytes_to_bits(value), bytes_utils.bytes_to_bits(value))
+
+    def test_prefix_conversions(self):
+        for binary_unit, decimal_unit in PREFIX_UNITS:
+            for value in self.values[:20]:
+                with self.subTest(binary_unit=binary_unit, decimal_unit=decimal_unit, value=value):
+                    self.assertAlmostEqual(
+                        bytes_numba.binary_prefix_to_decimal_prefix(value, binary_unit, decimal_unit),
+                        bytes_utils.binary_prefix_to_decimal_prefix(value, binary_unit, decimal_unit))
+                    self.assertAlmostEqual(
+                        bytes_numba.decimal_prefix_to_binary_prefix(value, decimal_unit, binary_unit),
+                        bytes_utils.decimal_prefix_to_binary_prefix(value, decimal_unit, binary_unit))
+
+        for convert in (bytes_numba.binary_prefix_to_decimal_prefix, bytes_numba.decimal_prefix_to_binary_prefix):
+            with self.subTest(convert=convert.__name__):
+                with self.assertRaises(ValueError):
+                    convert(1.0, 'XB', 'YB')
+
+    def test_bytes_to_human_readable_batch(self):
+        expected = [bytes_utils.bytes_to_human_readable(value) for value in self.values.tolist()]
+
+        sizes, unit_indices = bytes_numba.bytes_to_human_readable_batch(self.values)
+        self.assertEqual([f"{size:.2f} {bytes_utils._BYTE_UNITS[unit_index]}"
+                          for size, unit_index in zip(sizes.tolist(), unit_indices.tolist())], expected)
+        self.assertEqual([bytes_utils._BYTE_UNITS[bytes_numba.bytes_to_human_index(value)] for value in self.values],
+                         [string.split()[1] for string in expected])
+
+        # Integer arrays give the same result, multi-dimensional arrays are flattened
+        integers = np.array([0, 1023, 1024, 1048576, 2**62], dtype=np.int64)
+        sizes, unit_indices = bytes_numba.bytes_to_human_readable_batch(integers.reshape(1, -1))
+        self.assertEqual([f"{size:.2f} {bytes_utils._BYTE_UNITS[unit_index]}"
+                          for size, unit_index in zip(sizes.tolist(), unit_indices.tolist())],
+                         [bytes_utils.bytes_to_human_readable(value) for value in integers.tolist()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+sys.pycache_prefix = "/tmp/dstone/"
+
+import logging
+import os
+import tempfile
+import unittest
+
+from src.api.utils import logging as dstone_logging
+from src.api.utils.logging import configure_main_logger
+
+
+class TestLoggingModule(unittest.TestCase):
+
+    def setUp(self):
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        root.handlers.clear()
+
+        def restore():
+            dstone_logging._stop_listener()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+                handler.close()
+            root.handlers.extend(saved_handlers)
+            root.setLevel(saved_level)
+        self.addCleanup(restore)
+
+        log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(log_dir.cleanup)
+        self.log_dir = log_dir.name
+
+    def test_reconfigure_closes_replaced_handlers(self):
+        first_log = os.path.join(self.log_dir, 'first.log')
+        kept = logging.NullHandler()
+        configure_main_logger('INFO', first_log, log_to_stdout=False, additional_handlers=[kept])
+        first_listener = dstone_logging._listener
+        first_handlers = list(first_listener.handlers)
+        root_handlers = logging.getLogger().handlers[:]
+
+        second_log = os.path.join(self.log_dir, 'second.log')
+        configure_main_logger('INFO', second_log, log_to_stdout=False, additional_handlers=[kept])
+
+        # The first listener drained its queue and its file handler was closed
+        self.assertIsNot(dstone_logging._listener, first_listener)
+        self.assertIsNone(first_listener._thread)
+        file_handler = next(handler for handler in first_handlers if isinstance(handler, logging.FileHandler))
+        self.assertIsNone(file_handler.stream)
+        with open(first_log) as file:
+            self.assertIn("Main logger configured", file.read())
+
+        # Only the new queue handler is attached, the handler passed in again is still in use
+        self.assertEqual(len(logging.getLogger().handlers), 1)
+        self.assertNotIn(logging.getLogger().handlers[0], root_handlers)
+        self.assertIn(kept, dstone_logging._listener.handlers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import sys
+sys.pycache_prefix = "/tmp/dstone/"
+
+import logging
+import unittest
+
+from src.core import base_plugin
+from src.core.base_plugin import BasePlugin, _freeze_config
+
+
+class ConfigPlugin(BasePlugin):
+    """
+    A plugin that accepts any configuration and counts its validate_config calls.
+    """
+
+    validations = 0
+
+    def execute(self, *args, **kwargs):
+        pass
+
+    def setup_ui(self):
+        pass
+
+    def validate_config(self, config):
+        type(self).validations += 1
+        return True
+
+
+class TestBasePlugin(unittest.TestCase):
+
+    def test_class_attribute_metadata(self):
+        class Plugin(BasePlugin):
+            version = '2.0'
+            description = 'A plugin'
+
+            def execute(self, *args, **kwargs):
+                pass
+
+            def setup_ui(self):
+                pass
+
+            def validate_config(self, config):
+                return True
+
+        self.assertEqual(Plugin._meta, ('2.0', 'A plugin'))
+        plugin = Plugin.create(name='plugin', version=Plugin._meta.version,
+                               description=Plugin._meta.description, app=None)
+        self.assertEqual((plugin.version, plugin.description), ('2.0', 'A plugin'))
+
+    def test_slotted_class_attribute_metadata(self):
+        with self.assertRaisesRegex(TypeError, 'version'):
+            class Plugin(BasePlugin):
+                __slots__ = ()
+                version = '2.0'
+
+    def test_get_info_follows_fields(self):
+        class Plugin(ConfigPlugin):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.priority = 5
+
+        plugin = Plugin.create(name='plugin', version='0.1', description='A plugin', app=None)
+        info = plugin.get_info()
+        self.assertEqual(info['priority'], 5)
+
+        plugin.version = '0.2'
+        plugin.dependencies = ['other']
+        plugin.initialized = True
+        self.assertEqual((info['version'], info['dependencies'], info['initialized']), ('0.2', ['other'], True))
+        self.assertEqual(dict(plugin.get_info()), {
+            "name": 'plugin',
+            "version": '0.2',
+            "description": 'A plugin',
+            "aliases": [],
+            "priority": 5,
+            "dependencies": ['other'],
+            "sessionable": False,
+            "initialized": True,
+        })
+
+    def test_logger_can_be_replaced(self):
+        plugin = ConfigPlugin.create(name='plugin', version='0.1', description='', app=None)
+        logger = logging.getLogger('tests.core.base_plugin')
+        plugin.logger = logger
+        self.assertIs(plugin.logger, logger)
+
+    def test_freeze_config_keeps_container_types(self):
+        self.assertNotEqual(_freeze_config({'a': [1, 2]}), _freeze_config({'a': (1, 2)}))
+        self.assertNotEqual(_freeze_config({'a': {1}}), _freeze_config({'a': frozenset({1})}))
+        self.assertNotEqual(_freeze_config({'a': 1}), _freeze_config({'a': True}))
+        self.assertEqual(_freeze_config({'a': [1, {'b': 2}]}), _freeze_config({'a': [1, {'b': 2}]}))
+
+    def test_validate_config_runs_per_instance(self):
+        ConfigPlugin.validations = 0
+        for _ in range(3):
+            ConfigPlugin.create(name='plugin', version='0.1', description='', app=None, config={'a': 1})
+        self.assertEqual(ConfigPlugin.validations, 3)
+
+    def test_invalid_config_rejected(self):
+        class Plugin(ConfigPlugin):
+            _validation_schema = (('path', str, True), ('depth', int, False))
+
+            def validate_config(self, config):
+                return config.get('depth', 0) >= 0
+
+        Plugin.create(name='plugin', version='0.1', description='', app=None, config={'path': '/'})
+        for config in ({}, {'path': 1}, {'path': '/', 'depth': '1'}, {'path': '/', 'depth': -1}):
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    Plugin.create(name='plugin', version='0.1', description='', app=None, config=config)
+
+    def test_validated_configs_bounded(self):
+        size = base_plugin._VALIDATED_CONFIGS_SIZE
+        for index in range(size + 10):
+            ConfigPlugin.create(name='plugin', version='0.1', description='', app=None, config={'index': index})
+        self.assertLessEqual(len(base_plugin._validated_configs), size)
+
+        # The most recent schema checks are still cached, the oldest ones were evicted
+        self.assertIn((ConfigPlugin, _freeze_config({'index': size + 9})), base_plugin._validated_configs)
+        self.assertNotIn((ConfigPlugin, _freeze_config({'index': 0})), base_plugin._validated_configs)
+
+
+if __name__ == '__main__':
+    unittest.main()
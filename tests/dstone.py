@@ -0,0 +1,119 @@
+import sys
+sys.pycache_prefix = "/tmp/dstone/"
+
+import os
+import tempfile
+import unittest
+
+from src.core.base_plugin import BasePlugin
+from src.core.exceptions import DependencyError
+from src.dstone import DStone
+from src.plugins.dummy import DummyPlugin
+
+
+def make_plugin_class(priority=0, dependencies=(), executed=None):
+    """
+    Build a plugin class whose instances get the given priority and dependencies and
+    record their name in 'executed' when executed.
+    """
+    class Plugin(BasePlugin):
+
+        def __post_init__(self):
+            self.priority = priority
+            self.dependencies = list(dependencies)
+            super().__post_init__()
+
+        def execute(self, *args, **kwargs):
+            executed.append(self.name)
+
+        def setup_ui(self):
+            pass
+
+        def validate_config(self, config):
+            return True
+
+    return Plugin
+
+
+class TestDStonePlugins(unittest.TestCase):
+
+    def setUp(self):
+        plugins_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(plugins_dir.cleanup)
+        self.dstone = DStone(plugins_dir.name, plugins_dir.name)
+        self.executed = []
+
+    def register(self, name, priority=0, dependencies=()):
+        self.dstone.register_plugin(name, make_plugin_class(priority, dependencies, self.executed))
+
+    def test_execute_plugins_order(self):
+        # A dependency runs right before the first plugin that needs it, even with a later priority
+        self.register('a', priority=0, dependencies=['c'])
+        self.register('b', priority=1)
+        self.register('c', priority=2)
+        self.dstone.load_all_plugins()
+        self.dstone.execute_plugins()
+        self.assertEqual(self.executed, ['c', 'a', 'b'])
+
+    def test_execute_plugins_dependency_chain(self):
+        self.register('d', priority=3)
+        self.register('a', priority=0, dependencies=['b', 'd'])
+        self.register('b', priority=1, dependencies=['c'])
+        self.register('c', priority=2)
+        self.register('e', priority=0)
+        self.dstone.execute_plugins()
+        self.assertEqual(self.executed, ['c', 'b', 'd', 'a', 'e'])
+
+    def test_missing_dependency(self):
+        self.register('a', dependencies=['missing'])
+        for method in (self.dstone.execute_plugins, lambda: self.dstone.load_plugin('a')):
+            with self.subTest(method=method):
+                with self.assertRaises(DependencyError) as context:
+                    method()
+                self.assertEqual((context.exception.plugin, context.exception.dependency), ('a', 'missing'))
+                self.assertEqual(context.exception.reason, "not found")
+        self.assertEqual(self.executed, [])
+
+    def test_dependency_cycle(self):
+        self.register('a', dependencies=['b'])
+        self.register('b', dependencies=['c'])
+        self.register('c', dependencies=['a'])
+        for method in (self.dstone.execute_plugins, lambda: self.dstone.load_plugin('a')):
+            with self.subTest(method=method):
+                with self.assertRaises(DependencyError) as context:
+                    method()
+                self.assertEqual(context.exception.reason, "dependency cycle")
+        self.assertEqual(self.executed, [])
+        self.assertFalse(any(plugin.initialized for plugin in self.dstone.plugins.values()))
+
+    def test_load_plugin_loads_dependencies(self):
+        self.register('a', dependencies=['b'])
+        self.register('b', dependencies=['c'])
+        self.register('c')
+        self.register('d')
+        self.dstone.load_plugin('a')
+        self.assertEqual({name for name, plugin in self.dstone.plugins.items() if plugin.initialized},
+                         {'a', 'b', 'c'})
+
+        self.dstone.load_all_plugins()
+        self.assertTrue(all(plugin.initialized for plugin in self.dstone.plugins.values()))
+
+    def test_load_unknown_plugin(self):
+        with self.assertRaises(ValueError):
+            self.dstone.load_plugin('missing')
+
+    def test_register_invalidates_execution_order(self):
+        self.register('b', priority=1)
+        self.dstone.execute_plugins()
+        self.register('a', priority=0)
+        self.dstone.execute_plugins()
+        self.assertEqual(self.executed, ['b', 'a', 'b'])
+
+    def test_discover_plugins_uses_plugin_class(self):
+        plugins_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'plugins')
+        self.dstone.discover_plugins(plugins_dir)
+        self.assertIs(type(self.dstone.plugins['src.plugins.dummy']), DummyPlugin)
+
+
+if __name__ == '__main__':
+    unittest.main()